@@ -37,6 +37,25 @@ class PromptBuilder:
     - JSON Schema inclusion
     """
     
+    __slots__ = (
+        "templates_dir",
+        "schema_path",
+        "body_truncation_limit",
+        "candidate_top_n",
+        "candidate_dedup_enabled",
+        "redact_for_llm",
+        "default_temperature",
+        "default_max_tokens",
+        "default_model",
+        "shrink_body_limit",
+        "shrink_top_n",
+        "template_mode",
+        "jinja_env",
+        "json_schema",
+        "system_template",
+        "user_template",
+    )
+    
     def __init__(
         self,
         templates_dir: Path,
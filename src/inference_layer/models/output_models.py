@@ -4,6 +4,9 @@ Output data models for LLM Inference Layer.
 These models define the structured output returned by the LLM and validated
 by the multi-stage validation pipeline. They must conform to the strict
 JSON Schema (email_triage_v2).
+
+TopicResult, KeywordInText and EvidenceItem are frozen: the enrichment steps
+derive new instances with model_copy() instead of mutating them in place.
 """
 
 from typing import Optional
@@ -25,7 +28,7 @@ class KeywordInText(BaseModel):
     that matches candidateid.
     """
 
-    model_config = ConfigDict(extra="forbid")
+    model_config = ConfigDict(extra="forbid", frozen=True)
 
     candidateid: str = Field(
         ...,
@@ -69,7 +72,7 @@ class EvidenceItem(BaseModel):
     span is computed server-side from the quote; span_status records the match quality.
     """
 
-    model_config = ConfigDict(extra="forbid")
+    model_config = ConfigDict(extra="forbid", frozen=True)
 
     quote: str = Field(
         ...,
@@ -94,6 +97,11 @@ class EvidenceItem(BaseModel):
         description="SHA-256 of body_text_canonical used for span computation (audit)"
     )
 
+    @property
+    def quote_normalized(self) -> str:
+        """Quote stripped and lowercased for comparisons."""
+        return self.quote.strip().lower()
+
 
 class TopicResult(BaseModel):
     """
@@ -102,7 +110,7 @@ class TopicResult(BaseModel):
     Each email can have 1-5 topics. At least one topic is required (use UNKNOWNTOPIC if needed).
     """
     
-    model_config = ConfigDict(extra="forbid")
+    model_config = ConfigDict(extra="forbid", frozen=True)
     
     labelid: TopicsEnum = Field(..., description="Topic label from closed taxonomy")
     confidence: float = Field(..., ge=0.0, le=1.0, description="Classification confidence")
@@ -11,11 +11,11 @@ Storage Strategy:
 - TTL: Configurable per result type
 """
 
-import json
 import structlog
 from datetime import datetime
 from typing import Optional
 
+from pydantic_core import from_json, to_json
 from redis import Redis
 from redis.asyncio import Redis as AsyncRedis
 
@@ -25,6 +25,20 @@ from inference_layer.retry.exceptions import RetryExhausted
 
 logger = structlog.get_logger(__name__)
 
+# Resolve task_id -> request_uid -> result JSON server-side in one round-trip.
+# KEYS[1] = task mapping key, ARGV[1] = result key prefix.
+# The result key is built inside the script and is not declared in KEYS, so
+# this assumes a single Redis instance: under Redis Cluster the two keys may
+# live on different slots and the script would fail. Replace it with two
+# plain GETs before moving to a cluster deployment.
+_GET_BY_TASK_LUA = """
+local uid = redis.call('GET', KEYS[1])
+if not uid then
+    return nil
+end
+return redis.call('GET', ARGV[1] .. uid)
+"""
+
 
 class TriageRepository:
     """
@@ -51,6 +65,8 @@ class TriageRepository:
         self.redis = redis_client
         self.settings = settings
         self.result_ttl = settings.RESULT_TTL_SECONDS if hasattr(settings, 'RESULT_TTL_SECONDS') else 86400  # 24h default
+        # Registered locally; redis-py runs it via EVALSHA (loading it on first miss)
+        self._get_by_task_script = self.redis.register_script(_GET_BY_TASK_LUA)
 
     def save_raw_llm_output(self, request_uid: str, raw_json: str) -> bool:
         """
@@ -103,8 +119,11 @@ class TriageRepository:
             result_json = result.model_dump_json()
             result_key = f"{self.RESULT_PREFIX}{result.request_uid}"
             
+            # Batch all writes into one round-trip (no MULTI/EXEC needed)
+            pipe = self.redis.pipeline(transaction=False)
+            
             # Save result with TTL
-            self.redis.setex(
+            pipe.setex(
                 name=result_key,
                 time=self.result_ttl,
                 value=result_json
@@ -113,7 +132,7 @@ class TriageRepository:
             # Add to timestamp index for queries
             if result.created_at:
                 timestamp = datetime.fromisoformat(result.created_at).timestamp() if isinstance(result.created_at, str) else result.created_at.timestamp()
-                self.redis.zadd(
+                pipe.zadd(
                     self.RESULTS_INDEX,
                     {result.request_uid: timestamp}
                 )
@@ -121,12 +140,14 @@ class TriageRepository:
             # Map task_id to request_uid if provided
             if task_id:
                 task_key = f"{self.TASK_PREFIX}{task_id}"
-                self.redis.setex(
+                pipe.setex(
                     name=task_key,
                     time=self.result_ttl,
                     value=result.request_uid
                 )
             
+            pipe.execute()
+            
             logger.info(
                 "Saved triage result",
                 extra={
@@ -189,16 +210,20 @@ class TriageRepository:
             TriageResult if found, None otherwise
         """
         try:
-            # Get request_uid from task mapping
+            # Follow task mapping -> result in a single server-side script
             task_key = f"{self.TASK_PREFIX}{task_id}"
-            request_uid = self.redis.get(task_key)
+            result_json = self._get_by_task_script(
+                keys=[task_key], args=[self.RESULT_PREFIX]
+            )
             
-            if request_uid is None:
-                logger.debug("Task mapping not found", extra={"task_id": task_id})
+            if result_json is None:
+                logger.debug("Result not found for task_id", extra={"task_id": task_id})
                 return None
             
-            # Get result by request_uid
-            return self.get_result(request_uid)
+            result = TriageResult.model_validate_json(result_json)
+            
+            logger.debug("Retrieved result by task_id", extra={"task_id": task_id})
+            return result
         
         except Exception as e:
             logger.error(
@@ -265,14 +290,18 @@ class TriageRepository:
                 "request": exception.request.model_dump(mode="json"),
             }
             
-            # Serialize to JSON
-            dlq_json = json.dumps(dlq_entry)
+            # Serialize to JSON bytes (pydantic-core, ~3x faster than json.dumps)
+            dlq_json = to_json(dlq_entry)
+            
+            pipe = self.redis.pipeline(transaction=False)
             
             # Push to DLQ list (LPUSH = prepend, newest first)
-            self.redis.lpush(self.DLQ_KEY, dlq_json)
+            pipe.lpush(self.DLQ_KEY, dlq_json)
             
             # Trim to max size (keep last 10000 entries)
-            self.redis.ltrim(self.DLQ_KEY, 0, 9999)
+            pipe.ltrim(self.DLQ_KEY, 0, 9999)
+            
+            pipe.execute()
             
             logger.error(
                 "Saved to DLQ",
@@ -308,7 +337,7 @@ class TriageRepository:
             entries_json = self.redis.lrange(self.DLQ_KEY, 0, limit - 1)
             
             # Deserialize
-            entries = [json.loads(entry) for entry in entries_json]
+            entries = [from_json(entry) for entry in entries_json]
             
             logger.info("Retrieved DLQ entries", extra={"count": len(entries)})
             return entries
@@ -334,13 +363,26 @@ class TriageRepository:
         try:
             # Get recent request_uids from sorted set (reverse order = newest first)
             request_uids = self.redis.zrevrange(self.RESULTS_INDEX, 0, limit - 1)
+            if not request_uids:
+                return []
+            
+            # Fetch all results in one round-trip (MGET keeps the index order)
+            results_json = self.redis.mget(
+                [f"{self.RESULT_PREFIX}{uid}" for uid in request_uids]
+            )
             
-            # Fetch results
             results = []
-            for uid in request_uids:
-                result = self.get_result(uid)
-                if result:
-                    results.append(result)
+            for uid, result_json in zip(request_uids, results_json):
+                if result_json is None:
+                    # Result expired (TTL) but uid still in the index
+                    continue
+                try:
+                    results.append(TriageResult.model_validate_json(result_json))
+                except Exception as e:
+                    logger.error(
+                        "Failed to deserialize result",
+                        extra={"request_uid": uid, "error": str(e)},
+                    )
             
             logger.info("Retrieved recent results", extra={"count": len(results)})
             return results
@@ -361,8 +403,11 @@ class TriageRepository:
             Dict with stats (total results, DLQ size, etc.)
         """
         try:
-            total_results = self.redis.zcard(self.RESULTS_INDEX)
-            dlq_size = self.redis.llen(self.DLQ_KEY)
+            # Both counters in one round-trip (polled by health checks/dashboards)
+            pipe = self.redis.pipeline(transaction=False)
+            pipe.zcard(self.RESULTS_INDEX)
+            pipe.llen(self.DLQ_KEY)
+            total_results, dlq_size = pipe.execute()
             
             return {
                 "total_results": total_results,
@@ -403,6 +448,7 @@ class AsyncTriageRepository:
         self.redis = redis_client
         self.settings = settings
         self.result_ttl = settings.RESULT_TTL_SECONDS if hasattr(settings, 'RESULT_TTL_SECONDS') else 86400
+        self._get_by_task_script = self.redis.register_script(_GET_BY_TASK_LUA)
 
     async def save_raw_llm_output(self, request_uid: str, raw_json: str) -> bool:
         """Persist the raw LLM JSON output (async version).
@@ -440,7 +486,10 @@ class AsyncTriageRepository:
             result_json = result.model_dump_json()
             result_key = f"{self.RESULT_PREFIX}{result.request_uid}"
             
-            await self.redis.setex(
+            # Commands are buffered locally; only execute() hits Redis
+            pipe = self.redis.pipeline(transaction=False)
+            
+            pipe.setex(
                 name=result_key,
                 time=self.result_ttl,
                 value=result_json
@@ -448,19 +497,21 @@ class AsyncTriageRepository:
             
             if result.created_at:
                 timestamp = datetime.fromisoformat(result.created_at).timestamp() if isinstance(result.created_at, str) else result.created_at.timestamp()
-                await self.redis.zadd(
+                pipe.zadd(
                     self.RESULTS_INDEX,
                     {result.request_uid: timestamp}
                 )
             
             if task_id:
                 task_key = f"{self.TASK_PREFIX}{task_id}"
-                await self.redis.setex(
+                pipe.setex(
                     name=task_key,
                     time=self.result_ttl,
                     value=result.request_uid
                 )
             
+            await pipe.execute()
+            
             logger.info(
                 "Saved triage result (async)",
                 extra={"request_uid": result.request_uid, "task_id": task_id}
@@ -501,12 +552,14 @@ class AsyncTriageRepository:
         """Retrieve result by task ID (async version)."""
         try:
             task_key = f"{self.TASK_PREFIX}{task_id}"
-            request_uid = await self.redis.get(task_key)
+            result_json = await self._get_by_task_script(
+                keys=[task_key], args=[self.RESULT_PREFIX]
+            )
             
-            if request_uid is None:
+            if result_json is None:
                 return None
             
-            return await self.get_result(request_uid)
+            return TriageResult.model_validate_json(result_json)
         
         except Exception as e:
             logger.error(
@@ -519,8 +572,10 @@ class AsyncTriageRepository:
     async def get_stats(self) -> dict:
         """Get repository statistics (async version)."""
         try:
-            total_results = await self.redis.zcard(self.RESULTS_INDEX)
-            dlq_size = await self.redis.llen(self.DLQ_KEY)
+            pipe = self.redis.pipeline(transaction=False)
+            pipe.zcard(self.RESULTS_INDEX)
+            pipe.llen(self.DLQ_KEY)
+            total_results, dlq_size = await pipe.execute()
             
             return {
                 "total_results": total_results,
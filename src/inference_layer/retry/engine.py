@@ -65,6 +65,14 @@ class RetryEngine:
         strategies: List of retry strategies (ordered)
     """
 
+    __slots__ = (
+        "llm_client",
+        "prompt_builder",
+        "validation_pipeline",
+        "settings",
+        "strategies",
+    )
+
     def __init__(
         self,
         llm_client: BaseLLMClient,
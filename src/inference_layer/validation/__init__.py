@@ -16,11 +16,13 @@ from .exceptions import (
     BusinessRuleViolation,
 )
 from .pipeline import ValidationPipeline, ValidationContext
+from .verifiers import VerificationContext
 
 __all__ = [
     # Main pipeline
     "ValidationPipeline",
     "ValidationContext",
+    "VerificationContext",
     # Exceptions (for retry engine / API error handling)
     "ValidationError",
     "JSONParseError",
@@ -99,6 +99,9 @@ class BusinessRuleViolation(ValidationError):
     - candidateid not in input candidates (invented keyword)
     - labelid not in TopicsEnum (invented topic)
     - dictionaryversion mismatch
+    
+    When several rules fail at once, a single aggregate violation is raised
+    with the individual violations in ``sub_errors``.
     """
     
     def __init__(
@@ -107,7 +110,8 @@ class BusinessRuleViolation(ValidationError):
         rule_name: str | None = None,
         invalid_value: Any | None = None,
         expected_values: list[str] | None = None,
-        field_path: str | None = None
+        field_path: str | None = None,
+        sub_errors: list["BusinessRuleViolation"] | None = None
     ):
         """
         Initialize business rule violation.
@@ -118,6 +122,7 @@ class BusinessRuleViolation(ValidationError):
             invalid_value: The invalid value that caused the violation
             expected_values: List of valid values (for enum violations)
             field_path: JSON path to the violating field (e.g., "topics[0].labelid")
+            sub_errors: Individual violations aggregated into this error
         """
         details = {}
         if rule_name:
@@ -128,5 +133,8 @@ class BusinessRuleViolation(ValidationError):
             details["expected_values"] = expected_values[:20]  # Limit to first 20
         if field_path:
             details["field_path"] = field_path
+        if sub_errors:
+            details["sub_errors"] = [error.details for error in sub_errors]
         
         super().__init__(message, details)
+        self.sub_errors = sub_errors or []
@@ -12,6 +12,7 @@ Stages 1-3 raise exceptions (caught by retry engine).
 Stage 4 + verifiers accumulate warnings (non-blocking).
 """
 
+import asyncio
 import structlog
 from dataclasses import dataclass
 
@@ -32,6 +33,7 @@ from .verifiers import (
     EvidencePresenceVerifier,
     KeywordPresenceVerifier,
     SpansCoherenceVerifier,
+    VerificationContext,
 )
 
 logger = structlog.get_logger(__name__)
@@ -57,6 +59,9 @@ class ValidationPipeline:
     constraints and accumulating quality warnings.
     """
     
+    # Long-lived singleton: fixed attribute set, no per-instance __dict__
+    __slots__ = ("settings", "stage1", "stage2", "stage3", "stage4", "verifiers")
+    
     def __init__(self, settings: Settings):
         """
         Initialize validation pipeline.
@@ -69,6 +74,7 @@ class ValidationPipeline:
         # Initialize hard-fail stages (1-3)
         self.stage1 = Stage1JSONParse()
         self.stage2 = Stage2SchemaValidation(settings.JSON_SCHEMA_PATH)
+        self.stage2.compile()  # Pay schema load/compile once at startup, not on first request
         self.stage3 = Stage3BusinessRules()
         
         # Initialize warning stages (4)
@@ -86,9 +92,10 @@ class ValidationPipeline:
         self.verifiers.append(SpansCoherenceVerifier())
         
         logger.info(
-            f"ValidationPipeline initialized with {len(self.verifiers)} verifiers "
-            f"(evidence: {settings.ENABLE_EVIDENCE_PRESENCE_CHECK}, "
-            f"keyword: {settings.ENABLE_KEYWORD_PRESENCE_CHECK})"
+            "ValidationPipeline initialized",
+            verifier_count=len(self.verifiers),
+            evidence_check=settings.ENABLE_EVIDENCE_PRESENCE_CHECK,
+            keyword_check=settings.ENABLE_KEYWORD_PRESENCE_CHECK
         )
     
     async def validate(
@@ -112,17 +119,17 @@ class ValidationPipeline:
         warnings: list[str] = []
         
         logger.info(
-            f"Starting validation pipeline for request with "
-            f"{len(request.candidate_keywords)} candidates"
+            "Starting validation pipeline",
+            candidates=len(request.candidate_keywords)
         )
         
         try:
             # Stage 1: Parse JSON (hard fail)
-            logger.debug("Stage 1: Parsing JSON...")
+            logger.debug("Stage 1: Parsing JSON...", stage=1)
             parsed_dict = self.stage1.validate(llm_response.content)
             
             # Stage 2: Validate against JSON Schema (hard fail)
-            logger.debug("Stage 2: Validating JSON Schema...")
+            logger.debug("Stage 2: Validating JSON Schema...", stage=2)
             self.stage2.validate(parsed_dict)
             
             # Parse dict into Pydantic model (between Stage 2 and 3)
@@ -142,35 +149,22 @@ class ValidationPipeline:
                 )
             
             # Stage 3: Business rules (hard fail)
-            logger.debug("Stage 3: Validating business rules...")
+            logger.debug("Stage 3: Validating business rules...", stage=3)
             self.stage3.validate(response, request)
 
-            # Enrichment: Back-fill optional KeywordInText fields from candidates
-            logger.debug("Enrichment: Back-filling keyword fields from candidates...")
-            response, enrichment_warnings = enrich_response_keywords(response, request)
-            warnings.extend(enrichment_warnings)
-
-            # Span calculation: Compute server-side evidence spans from quotes
-            logger.debug("Span calculation: Computing evidence spans server-side...")
-            response, span_warnings = enrich_response_spans(response, request)
-            warnings.extend(span_warnings)
-
-            # Stage 4: Quality checks (warnings only)
-            logger.debug("Stage 4: Running quality checks...")
-            quality_warnings = self.stage4.validate(response)
-            warnings.extend(quality_warnings)
-            
-            # Run verifiers (warnings only)
-            logger.debug(f"Running {len(self.verifiers)} verifiers...")
-            for verifier in self.verifiers:
-                verifier_warnings = verifier.verify(response, request)
-                warnings.extend(verifier_warnings)
+            # Enrichment, span calculation, Stage 4 and verifiers are CPU-bound
+            # (fuzzy span matching scans the whole body): run them off the event loop
+            response, post_validation_warnings = await asyncio.to_thread(
+                self._run_warning_stages, response, request
+            )
+            warnings.extend(post_validation_warnings)
             
             # Log summary
             if warnings:
                 logger.warning(
-                    f"Validation completed with {len(warnings)} warning(s): "
-                    f"{warnings[:3]}{'...' if len(warnings) > 3 else ''}"
+                    "Validation completed with warnings",
+                    warning_count=len(warnings),
+                    warnings=warnings[:3]
                 )
             else:
                 logger.info("Validation completed successfully with no warnings")
@@ -182,8 +176,59 @@ class ValidationPipeline:
             raise
         except Exception as e:
             # Wrap unexpected errors as ValidationError
-            logger.exception(f"Unexpected error during validation: {e}")
+            logger.exception("Unexpected error during validation", error=str(e))
             raise ValidationError(
                 f"Unexpected validation error: {str(e)}",
                 details={"error_type": type(e).__name__}
             ) from e
+    
+    def _run_warning_stages(
+        self,
+        response: EmailTriageResponse,
+        request: TriageRequest
+    ) -> tuple[EmailTriageResponse, list[str]]:
+        """
+        Run the non-blocking steps after Stage 3.
+        
+        Keyword enrichment, span calculation, Stage 4 and verifiers only
+        produce warnings. Synchronous so validate() can run it in a worker thread.
+        
+        Args:
+            response: Response that passed Stages 1-3
+            request: Original triage request with email and candidates
+            
+        Returns:
+            Tuple of (enriched EmailTriageResponse, list of warning strings)
+        """
+        warnings: list[str] = []
+        
+        # Enrichment: Back-fill optional KeywordInText fields from candidates
+        logger.debug("Enrichment: Back-filling keyword fields from candidates...")
+        response, enrichment_warnings = enrich_response_keywords(response, request)
+        warnings.extend(enrichment_warnings)
+
+        # Span calculation: Compute server-side evidence spans from quotes
+        logger.debug("Span calculation: Computing evidence spans server-side...")
+        response, span_warnings = enrich_response_spans(response, request)
+        warnings.extend(span_warnings)
+
+        # Stage 4: Quality checks (warnings only)
+        logger.debug("Stage 4: Running quality checks...", stage=4)
+        quality_warnings = self.stage4.validate(response)
+        warnings.extend(quality_warnings)
+        
+        # Run verifiers (warnings only)
+        verification_context = VerificationContext.from_request(request)
+        if not verification_context.email_text:
+            # Nothing to verify against: one warning instead of one per verifier
+            warnings.append("Email body_text_canonical is empty, verifiers skipped")
+        else:
+            logger.debug(
+                "Running verifiers",
+                verifiers=[type(v).__name__ for v in self.verifiers],
+            )
+            for verifier in self.verifiers:
+                verifier_warnings = verifier.verify(response, request, verification_context)
+                warnings.extend(verifier_warnings)
+        
+        return response, warnings
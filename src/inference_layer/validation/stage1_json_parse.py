@@ -5,8 +5,8 @@ Parse raw LLM response content (string) into Python dict.
 This is a hard-fail stage: malformed JSON triggers retry.
 """
 
-import json
 import structlog
+from pydantic_core import from_json
 
 from inference_layer.monitoring.metrics import validation_failures_total
 from .exceptions import JSONParseError
@@ -45,7 +45,8 @@ class Stage1JSONParse:
             )
         
         try:
-            parsed = json.loads(content)
+            # pydantic-core's Rust parser: ~2x faster than json.loads on LLM outputs
+            parsed = from_json(content)
             
             if not isinstance(parsed, dict):
                 validation_failures_total.labels(
@@ -60,18 +61,19 @@ class Stage1JSONParse:
             logger.debug(f"Stage 1: Successfully parsed JSON with {len(parsed)} top-level keys")
             return parsed
             
-        except json.JSONDecodeError as e:
+        except JSONParseError:
+            # Re-raise our own exceptions
+            raise
+        except ValueError as e:
+            # from_json reports "<reason> at line L column C"
             validation_failures_total.labels(
                 stage="stage1", error_type="json_decode_error"
             ).inc()
             raise JSONParseError(
-                f"Failed to parse LLM response as JSON: {e.msg}",
+                f"Failed to parse LLM response as JSON: {e}",
                 raw_content=content,
-                parse_error=f"{e.msg} at line {e.lineno} col {e.colno}"
+                parse_error=str(e)
             ) from e
-        except JSONParseError:
-            # Re-raise our own exceptions
-            raise
         except Exception as e:
             # Catch any other unexpected errors
             validation_failures_total.labels(
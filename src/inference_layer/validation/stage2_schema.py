@@ -8,7 +8,9 @@ This is a hard-fail stage: schema violations trigger retry.
 import json
 import structlog
 from pathlib import Path
+from typing import Any, Callable
 
+import fastjsonschema
 import jsonschema
 from jsonschema import Draft7Validator
 
@@ -23,6 +25,9 @@ class Stage2SchemaValidation:
     Stage 2 validator: Validate against JSON Schema.
     
     Raises SchemaValidationError on schema violations (hard fail).
+    
+    Valid responses are checked by a fastjsonschema-generated function;
+    jsonschema only runs on failures, to collect the full error list.
     """
     
     def __init__(self, schema_path: str):
@@ -35,6 +40,7 @@ class Stage2SchemaValidation:
         self.schema_path = schema_path
         self._schema: dict | None = None
         self._validator: Draft7Validator | None = None
+        self._fast_validate: Callable[[dict], Any] | None = None
     
     def _load_schema(self) -> dict:
         """
@@ -89,9 +95,37 @@ class Stage2SchemaValidation:
         """
         if self._validator is None:
             schema = self._load_schema()
+            
+            # Check the schema itself once, so a broken schema fails here
+            # instead of surfacing as confusing per-response errors
+            try:
+                Draft7Validator.check_schema(schema)
+            except jsonschema.SchemaError as e:
+                validation_failures_total.labels(
+                    stage="stage2", error_type="schema_invalid"
+                ).inc()
+                raise SchemaValidationError(
+                    f"Invalid JSON Schema: {e.message}",
+                    schema_path=self.schema_path
+                ) from e
+            
             self._validator = Draft7Validator(schema)
+            # Formats are not asserted by Draft7Validator either, and neither
+            # validator may fill schema defaults into the parsed response
+            self._fast_validate = fastjsonschema.compile(
+                schema, use_formats=False, use_default=False
+            )
         return self._validator
     
+    def compile(self) -> None:
+        """
+        Load and compile the schema validator ahead of the first validate() call.
+        
+        Raises:
+            SchemaValidationError: If schema file cannot be loaded or is invalid
+        """
+        self._get_validator()
+    
     def validate(self, data: dict) -> None:
         """
         Validate data against JSON Schema.
@@ -104,8 +138,14 @@ class Stage2SchemaValidation:
         """
         validator = self._get_validator()
         
-        # Collect all validation errors
-        errors = list(validator.iter_errors(data))
+        # Fast path: generated validator accepts the (common) valid response
+        try:
+            self._fast_validate(data)
+        except fastjsonschema.JsonSchemaException:
+            # Collect all validation errors (jsonschema is authoritative)
+            errors = list(validator.iter_errors(data))
+        else:
+            errors = []
         
         if errors:
             # Format error messages for logging
@@ -19,12 +19,32 @@ from .exceptions import BusinessRuleViolation
 
 logger = structlog.get_logger(__name__)
 
+# Valid enum values, materialized once at import (closed taxonomies never change at runtime)
+VALID_TOPICS: frozenset[str] = frozenset({topic.value for topic in TopicsEnum})
+VALID_SENTIMENTS: frozenset[str] = frozenset({sentiment.value for sentiment in SentimentEnum})
+VALID_PRIORITIES: frozenset[str] = frozenset({priority.value for priority in PriorityEnum})
+
+# Labeled failure counters, resolved once and keyed by rule name. The counter
+# is bumped once per rejected response: several violations count as one
+# "multiple_rules" failure, mirroring the raised error.
+_FAIL_COUNTERS = {
+    rule_name: validation_failures_total.labels(stage="stage3", error_type=error_type)
+    for rule_name, error_type in (
+        ("dictionary_version_match", "dictionary_version_mismatch"),
+        ("topic_label_in_enum", "invalid_topic_label"),
+        ("candidateid_exists_in_input", "invalid_candidateid"),
+        ("sentiment_in_enum", "invalid_sentiment"),
+        ("priority_in_enum", "invalid_priority"),
+        ("multiple_rules", "multiple_rules"),
+    )
+}
 
 class Stage3BusinessRules:
     """
     Stage 3 validator: Business rules enforcement.
     
-    Raises BusinessRuleViolation on rule violations (hard fail).
+    All rules are evaluated before failing, so a single BusinessRuleViolation
+    reports every issue in the response (hard fail).
     """
     
     def validate(self, response: EmailTriageResponse, request: TriageRequest) -> None:
@@ -36,19 +56,34 @@ class Stage3BusinessRules:
             request: Original TriageRequest with candidates and version
             
         Raises:
-            BusinessRuleViolation: If any business rule is violated
+            BusinessRuleViolation: If any business rule is violated. When several
+                rules fail, the raised error aggregates them in ``sub_errors``.
         """
+        violations: list[BusinessRuleViolation] = []
+        
         # Rule 1: Dictionary version must match
-        self._validate_dictionary_version(response, request)
+        violations.extend(self._validate_dictionary_version(response, request))
         
         # Rule 2: All topic labelids must be in TopicsEnum
-        self._validate_topic_labels(response)
+        violations.extend(self._validate_topic_labels(response))
         
         # Rule 3: All candidateids must exist in input candidates
-        self._validate_candidateids(response, request)
+        violations.extend(self._validate_candidateids(response, request))
         
         # Rule 4: Sentiment and Priority must be valid enums (redundant with schema, but explicit check)
-        self._validate_sentiment_priority(response)
+        violations.extend(self._validate_sentiment_priority(response))
+        
+        if len(violations) == 1:
+            _FAIL_COUNTERS[violations[0].details["rule_name"]].inc()
+            raise violations[0]
+        if violations:
+            _FAIL_COUNTERS["multiple_rules"].inc()
+            raise BusinessRuleViolation(
+                f"{len(violations)} business rule violations: "
+                + "; ".join(violation.message for violation in violations),
+                rule_name="multiple_rules",
+                sub_errors=violations
+            )
         
         logger.debug("Stage 3: All business rules validated successfully")
     
@@ -56,7 +91,7 @@ class Stage3BusinessRules:
         self, 
         response: EmailTriageResponse, 
         request: TriageRequest
-    ) -> None:
+    ) -> list[BusinessRuleViolation]:
         """
         Validate that dictionary version matches input request.
         
@@ -64,52 +99,50 @@ class Stage3BusinessRules:
             response: LLM response
             request: Input request
             
-        Raises:
-            BusinessRuleViolation: If versions don't match
+        Returns:
+            List with one violation if versions don't match, empty otherwise
         """
+        violations: list[BusinessRuleViolation] = []
         if response.dictionaryversion != request.dictionary_version:
-            validation_failures_total.labels(
-                stage="stage3", error_type="dictionary_version_mismatch"
-            ).inc()
-            raise BusinessRuleViolation(
+            violations.append(BusinessRuleViolation(
                 f"Dictionary version mismatch: response has {response.dictionaryversion}, "
                 f"expected {request.dictionary_version}",
                 rule_name="dictionary_version_match",
                 invalid_value=response.dictionaryversion,
                 expected_values=[str(request.dictionary_version)],
                 field_path="dictionaryversion"
-            )
+            ))
+        
+        return violations
     
-    def _validate_topic_labels(self, response: EmailTriageResponse) -> None:
+    def _validate_topic_labels(self, response: EmailTriageResponse) -> list[BusinessRuleViolation]:
         """
         Validate that all topic labels are in TopicsEnum.
         
         Args:
             response: LLM response
             
-        Raises:
-            BusinessRuleViolation: If any labelid is not in enum
+        Returns:
+            One violation per labelid not in enum
         """
-        valid_topics = set(topic.value for topic in TopicsEnum)
-        
+        violations: list[BusinessRuleViolation] = []
         for i, topic in enumerate(response.topics):
-            if topic.labelid not in valid_topics:
-                validation_failures_total.labels(
-                    stage="stage3", error_type="invalid_topic_label"
-                ).inc()
-                raise BusinessRuleViolation(
+            if topic.labelid not in VALID_TOPICS:
+                violations.append(BusinessRuleViolation(
                     f"Topic labelid '{topic.labelid}' is not in TopicsEnum",
                     rule_name="topic_label_in_enum",
                     invalid_value=topic.labelid,
-                    expected_values=sorted(valid_topics),
+                    expected_values=sorted(VALID_TOPICS),
                     field_path=f"topics[{i}].labelid"
-                )
+                ))
+        
+        return violations
     
     def _validate_candidateids(
         self, 
         response: EmailTriageResponse, 
         request: TriageRequest
-    ) -> None:
+    ) -> list[BusinessRuleViolation]:
         """
         Validate that all candidateids exist in input candidates.
         
@@ -119,29 +152,39 @@ class Stage3BusinessRules:
             response: LLM response
             request: Input request with candidate keywords
             
-        Raises:
-            BusinessRuleViolation: If any candidateid doesn't exist in input
+        Returns:
+            One violation per candidateid that doesn't exist in input
         """
+        violations: list[BusinessRuleViolation] = []
+        
         # Build set of valid candidate IDs
-        valid_candidateids = {candidate.candidate_id for candidate in request.candidate_keywords}
+        valid_candidateids: set[str] = {candidate.candidate_id for candidate in request.candidate_keywords}
+        
+        # Happy path is a single set difference; only walk the topics to
+        # locate offenders when some candidateid is unknown
+        invalid_candidateids: set[str] = {
+            keyword.candidateid
+            for topic in response.topics
+            for keyword in topic.keywordsintext
+        } - valid_candidateids
+        if not invalid_candidateids:
+            return violations
         
-        # Check all keywords in all topics
         for topic_idx, topic in enumerate(response.topics):
             for kw_idx, keyword in enumerate(topic.keywordsintext):
-                if keyword.candidateid not in valid_candidateids:
-                    validation_failures_total.labels(
-                        stage="stage3", error_type="invalid_candidateid"
-                    ).inc()
-                    raise BusinessRuleViolation(
+                if keyword.candidateid in invalid_candidateids:
+                    violations.append(BusinessRuleViolation(
                         f"Keyword candidateid '{keyword.candidateid}' not found in input candidates "
                         f"(LLM invented a keyword)",
                         rule_name="candidateid_exists_in_input",
                         invalid_value=keyword.candidateid,
                         expected_values=None,  # Too many to list
                         field_path=f"topics[{topic_idx}].keywordsintext[{kw_idx}].candidateid"
-                    )
+                    ))
+        
+        return violations
     
-    def _validate_sentiment_priority(self, response: EmailTriageResponse) -> None:
+    def _validate_sentiment_priority(self, response: EmailTriageResponse) -> list[BusinessRuleViolation]:
         """
         Validate sentiment and priority enum values.
         
@@ -151,34 +194,30 @@ class Stage3BusinessRules:
         Args:
             response: LLM response
             
-        Raises:
-            BusinessRuleViolation: If sentiment or priority value is invalid
+        Returns:
+            Violations for invalid sentiment and/or priority values
         """
+        violations: list[BusinessRuleViolation] = []
+        
         # Validate sentiment
-        valid_sentiments = set(sentiment.value for sentiment in SentimentEnum)
-        if response.sentiment.value not in valid_sentiments:
-            validation_failures_total.labels(
-                stage="stage3", error_type="invalid_sentiment"
-            ).inc()
-            raise BusinessRuleViolation(
+        if response.sentiment.value not in VALID_SENTIMENTS:
+            violations.append(BusinessRuleViolation(
                 f"Sentiment value '{response.sentiment.value}' is not in SentimentEnum",
                 rule_name="sentiment_in_enum",
                 invalid_value=response.sentiment.value,
-                expected_values=sorted(valid_sentiments),
+                expected_values=sorted(VALID_SENTIMENTS),
                 field_path="sentiment.value"
-            )
+            ))
         
         # Validate priority
-        valid_priorities = set(priority.value for priority in PriorityEnum)
-        if response.priority.value not in valid_priorities:
-            validation_failures_total.labels(
-                stage="stage3", error_type="invalid_priority"
-            ).inc()
-            raise BusinessRuleViolation(
+        if response.priority.value not in VALID_PRIORITIES:
+            violations.append(BusinessRuleViolation(
                 f"Priority value '{response.priority.value}' is not in PriorityEnum",
                 rule_name="priority_in_enum",
                 invalid_value=response.priority.value,
-                expected_values=sorted(valid_priorities),
+                expected_values=sorted(VALID_PRIORITIES),
                 field_path="priority.value"
-            )
+            ))
+        
+        return violations
 
@@ -9,6 +9,8 @@ Non-blocking quality checks that produce warnings:
 Unlike Stages 1-3, these do NOT raise exceptions - they accumulate warnings.
 """
 
+from collections.abc import Iterator
+
 import structlog
 
 from ..models.output_models import EmailTriageResponse
@@ -42,24 +44,37 @@ class Stage4QualityChecks:
         Returns:
             List of warning messages (empty if no quality issues)
         """
-        warnings: list[str] = []
-        
-        # Check 1: Low confidence warnings
-        warnings.extend(self._check_low_confidence(response))
-        
-        # Check 2: Duplicate detection
-        warnings.extend(self._check_duplicates(response))
-        
-        # Check 3: Completeness checks
-        warnings.extend(self._check_completeness(response))
+        warnings = list(self.iter_warnings(response))
         
         if warnings:
-            logger.info(f"Stage 4: Generated {len(warnings)} quality warning(s)")
+            logger.info("Stage 4: Generated quality warnings", count=len(warnings))
         else:
             logger.debug("Stage 4: No quality issues detected")
         
         return warnings
     
+    def iter_warnings(self, response: EmailTriageResponse) -> Iterator[str]:
+        """
+        Lazily yield quality warnings, one check at a time.
+        
+        Callers that only need the first warning (or whether any exists) can
+        stop early without running the remaining checks.
+        
+        Args:
+            response: Validated EmailTriageResponse
+            
+        Yields:
+            Warning messages in the same order as validate()
+        """
+        # Check 1: Low confidence warnings
+        yield from self._check_low_confidence(response)
+        
+        # Check 2: Duplicate detection
+        yield from self._check_duplicates(response)
+        
+        # Check 3: Completeness checks
+        yield from self._check_completeness(response)
+    
     def _check_low_confidence(self, response: EmailTriageResponse) -> list[str]:
         """
         Check for low confidence scores.
@@ -108,39 +123,44 @@ class Stage4QualityChecks:
         """
         warnings: list[str] = []
         
+        # Each check compares list and set sizes first and only walks the list
+        # to locate duplicates when the sizes differ
+        
         # Check duplicate topics (same labelid)
         topic_labels = [topic.labelid for topic in response.topics]
-        seen_labels = set()
-        for i, label in enumerate(topic_labels):
-            if label in seen_labels:
-                warnings.append(f"Duplicate topic '{label}' at index {i}")
-            seen_labels.add(label)
+        if len(set(topic_labels)) != len(topic_labels):
+            seen_labels = set()
+            for i, label in enumerate(topic_labels):
+                if label in seen_labels:
+                    warnings.append(f"Duplicate topic '{label}' at index {i}")
+                seen_labels.add(label)
         
         # Check duplicate keywords within each topic
         for topic_idx, topic in enumerate(response.topics):
             candidateids = [kw.candidateid for kw in topic.keywordsintext]
-            seen_ids = set()
-            for kw_idx, cid in enumerate(candidateids):
-                if cid in seen_ids:
-                    warnings.append(
-                        f"Duplicate keyword candidateid '{cid}' in topic '{topic.labelid}' "
-                        f"(topic index {topic_idx}, keyword index {kw_idx})"
-                    )
-                seen_ids.add(cid)
+            if len(set(candidateids)) != len(candidateids):
+                seen_ids = set()
+                for kw_idx, cid in enumerate(candidateids):
+                    if cid in seen_ids:
+                        warnings.append(
+                            f"Duplicate keyword candidateid '{cid}' in topic '{topic.labelid}' "
+                            f"(topic index {topic_idx}, keyword index {kw_idx})"
+                        )
+                    seen_ids.add(cid)
         
         # Check duplicate evidence quotes within each topic
         for topic_idx, topic in enumerate(response.topics):
-            quotes = [ev.quote for ev in topic.evidence]
-            seen_quotes = set()
-            for ev_idx, quote in enumerate(quotes):
-                # Normalize for comparison (lowercase, strip whitespace)
-                normalized = quote.lower().strip()
-                if normalized in seen_quotes:
-                    warnings.append(
-                        f"Duplicate evidence quote in topic '{topic.labelid}' "
-                        f"(topic index {topic_idx}, evidence index {ev_idx})"
-                    )
-                seen_quotes.add(normalized)
+            # Compare normalized quotes (stripped, lowercased)
+            quotes = [ev.quote_normalized for ev in topic.evidence]
+            if len(set(quotes)) != len(quotes):
+                seen_quotes = set()
+                for ev_idx, normalized in enumerate(quotes):
+                    if normalized in seen_quotes:
+                        warnings.append(
+                            f"Duplicate evidence quote in topic '{topic.labelid}' "
+                            f"(topic index {topic_idx}, evidence index {ev_idx})"
+                        )
+                    seen_quotes.add(normalized)
         
         return warnings
     
@@ -156,33 +176,30 @@ class Stage4QualityChecks:
         """
         warnings: list[str] = []
         
-        # Check topics without keywords
+        # Single pass over topics: missing keywords, missing evidence, long quotes
         for i, topic in enumerate(response.topics):
             if not topic.keywordsintext:
                 warnings.append(
                     f"Topic '{topic.labelid}' at index {i} has no keywords"
                 )
-        
-        # Check topics without evidence
-        for i, topic in enumerate(response.topics):
+            
             if not topic.evidence:
                 warnings.append(
                     f"Topic '{topic.labelid}' at index {i} has no evidence"
                 )
-        
-        # Check priority signals completeness
-        if not response.priority.signals:
-            warnings.append("Priority has no signals (expected 1-6 signals)")
-        
-        # Check for suspiciously long quotes (approaching max length)
-        for topic_idx, topic in enumerate(response.topics):
+            
+            # Check for suspiciously long quotes (approaching max length)
             for ev_idx, evidence in enumerate(topic.evidence):
                 if len(evidence.quote) > 180:  # Warn if > 180 chars (max is 200)
                     warnings.append(
                         f"Evidence quote is very long ({len(evidence.quote)} chars) "
-                        f"in topic '{topic.labelid}' (topic index {topic_idx}, "
+                        f"in topic '{topic.labelid}' (topic index {i}, "
                         f"evidence index {ev_idx})"
                     )
         
+        # Check priority signals completeness
+        if not response.priority.signals:
+            warnings.append("Priority has no signals (expected 1-6 signals)")
+        
         return warnings
 
@@ -10,14 +10,93 @@ Like Stage 4, these produce warnings (not exceptions).
 """
 
 import logging
-from typing import Optional
+import operator
+from dataclasses import dataclass, field
+from typing import NamedTuple, Optional
 
-from ..models.input_models import EmailDocument, TriageRequest
+from ..models.input_models import CandidateKeyword, EmailDocument, TriageRequest
 from ..models.output_models import EmailTriageResponse
 
 logger = logging.getLogger(__name__)
 
 
+# Integer coercion for span indices (single C slot call instead of isinstance checks)
+_index = operator.index
+
+# Span description templates, formatted only when a span is reported
+_KEYWORD_SPAN_CONTEXT = "keyword '{}' in topic '{}'"
+_EVIDENCE_SPAN_CONTEXT = "evidence in topic '{}'"
+
+
+class _CandidateText(NamedTuple):
+    """Candidate term/lemma with their lowercased forms, computed once."""
+    term: str
+    lemma: str
+    term_lower: str
+    lemma_lower: str
+
+
+def _maybe_lower(text: str) -> str:
+    """
+    Lowercase *text*, returning it unchanged when already lowercase ASCII.
+    
+    Canonicalized bodies are often already lowercase; this skips the copy
+    ``str.lower()`` would otherwise always allocate.
+    """
+    if text.isascii() and text.islower():
+        return text
+    return text.lower()
+
+
+@dataclass(frozen=True)
+class VerificationContext:
+    """
+    Per-request data shared by all verifiers.
+    
+    Built once by the pipeline so the body is lowercased and the candidate
+    lookup is built a single time instead of once per verifier.
+    """
+    email_text: str
+    email_text_lower: str
+    text_length: int
+    candidate_map: dict[str, _CandidateText] = field(default_factory=dict)
+    
+    @classmethod
+    def from_request(cls, request: TriageRequest) -> "VerificationContext":
+        """
+        Build the verification context for a request.
+        
+        Args:
+            request: Original request with email document and candidates
+            
+        Returns:
+            VerificationContext with raw, lowercased and length of the body text,
+            plus the candidateid lookup map
+        """
+        email_text = request.email.body_text_canonical or ""
+        return cls(
+            email_text=email_text,
+            email_text_lower=_maybe_lower(email_text),
+            text_length=len(email_text),
+            candidate_map=_build_candidate_map(request.candidate_keywords),
+        )
+
+
+def _build_candidate_map(
+    candidate_keywords: list[CandidateKeyword],
+) -> dict[str, _CandidateText]:
+    """Map candidateid to its term/lemma, lowercased once per request."""
+    return {
+        candidate.candidate_id: _CandidateText(
+            term=candidate.term,
+            lemma=candidate.lemma,
+            term_lower=candidate.term.lower(),
+            lemma_lower=candidate.lemma.lower(),
+        )
+        for candidate in candidate_keywords
+    }
+
+
 class EvidencePresenceVerifier:
     """
     Verify that evidence quotes exist in the original email text.
@@ -25,37 +104,52 @@ class EvidencePresenceVerifier:
     This catches cases where LLM fabricates or hallucinates evidence.
     """
     
-    def verify(self, response: EmailTriageResponse, request: TriageRequest) -> list[str]:
+    def verify(
+        self,
+        response: EmailTriageResponse,
+        request: TriageRequest,
+        context: VerificationContext | None = None
+    ) -> list[str]:
         """
         Check if evidence quotes are present in email text.
         
         Args:
             response: LLM response with evidence quotes
             request: Original request with email document
+            context: Shared verification context (built from request if omitted)
             
         Returns:
             List of warnings for missing evidence
         """
         warnings: list[str] = []
+        append = warnings.append
+        
+        if context is None:
+            context = VerificationContext.from_request(request)
         
         # Get canonical email body text
-        email_text = request.email.body_text_canonical
+        email_text = context.email_text
         if not email_text:
-            warnings.append("Email body_text_canonical is empty, cannot verify evidence presence")
+            append("Email body_text_canonical is empty, cannot verify evidence presence")
             return warnings
         
-        # Normalize text for comparison (case-insensitive)
-        email_text_lower = email_text.lower()
+        # Lowercased once per request (case-insensitive comparison)
+        email_text_lower = context.email_text_lower
+        
+        # The same quote often backs several topics: scan the body once per distinct quote
+        quote_found: dict[str, bool] = {}
         
         for topic_idx, topic in enumerate(response.topics):
             for ev_idx, evidence in enumerate(topic.evidence):
-                quote = evidence.quote.strip()
-                quote_lower = quote.lower()
+                quote_lower = evidence.quote_normalized
                 
                 # Check if quote appears as substring
-                if quote_lower not in email_text_lower:
-                    warnings.append(
-                        f"Evidence quote not found in email text: '{quote[:100]}...' "
+                found = quote_found.get(quote_lower)
+                if found is None:
+                    found = quote_found[quote_lower] = quote_lower in email_text_lower
+                if not found:
+                    append(
+                        f"Evidence quote not found in email text: '{evidence.quote.strip()[:100]}...' "
                         f"(topic '{topic.labelid}', topic index {topic_idx}, "
                         f"evidence index {ev_idx})"
                     )
@@ -64,13 +158,13 @@ class EvidencePresenceVerifier:
                 # If span is provided, verify it matches the quote
                 if evidence.span:
                     span_start, span_end = evidence.span
-                    if self._verify_span(email_text, quote, span_start, span_end):
+                    if self._verify_span(email_text, quote_lower, span_start, span_end):
                         logger.debug(
                             f"Evidence span verified: [{span_start}:{span_end}] "
                             f"matches quote in topic '{topic.labelid}'"
                         )
                     else:
-                        warnings.append(
+                        append(
                             f"Evidence span [{span_start}:{span_end}] does not match quote "
                             f"in topic '{topic.labelid}' (topic index {topic_idx}, "
                             f"evidence index {ev_idx})"
@@ -79,13 +173,13 @@ class EvidencePresenceVerifier:
         return warnings
     
     @staticmethod
-    def _verify_span(text: str, quote: str, start: int, end: int) -> bool:
+    def _verify_span(text: str, quote_lower: str, start: int, end: int) -> bool:
         """
         Verify that span [start:end] in text matches the quote.
         
         Args:
             text: Full email text
-            quote: Expected quote string
+            quote_lower: Expected quote, already stripped and lowercased
             start: Start index
             end: End index
             
@@ -95,10 +189,12 @@ class EvidencePresenceVerifier:
         if start < 0 or end > len(text) or start >= end:
             return False
         
-        extracted = text[start:end].strip().lower()
-        quote_normalized = quote.strip().lower()
+        # Only chars that lowercase to a single char can match an ASCII quote,
+        # so a shorter span can be rejected without slicing or lowercasing
+        if end - start < len(quote_lower) and quote_lower.isascii():
+            return False
         
-        return extracted == quote_normalized
+        return text[start:end].strip().lower() == quote_lower
 
 
 class KeywordPresenceVerifier:
@@ -109,36 +205,44 @@ class KeywordPresenceVerifier:
     mismatches candidates to email content.
     """
     
-    def verify(self, response: EmailTriageResponse, request: TriageRequest) -> list[str]:
+    def verify(
+        self,
+        response: EmailTriageResponse,
+        request: TriageRequest,
+        context: VerificationContext | None = None
+    ) -> list[str]:
         """
         Check if keywords are present in email text.
         
         Args:
             response: LLM response with selected keywords
             request: Original request with email document and candidates
+            context: Shared verification context (built from request if omitted)
             
         Returns:
             List of warnings for keywords not found in text
         """
         warnings: list[str] = []
+        append = warnings.append
+        
+        if context is None:
+            context = VerificationContext.from_request(request)
         
         # Get canonical email body text
-        email_text = request.email.body_text_canonical
+        email_text = context.email_text
         if not email_text:
-            warnings.append("Email body_text_canonical is empty, cannot verify keyword presence")
+            append("Email body_text_canonical is empty, cannot verify keyword presence")
             return warnings
         
-        # Normalize text for comparison (case-insensitive)
-        email_text_lower = email_text.lower()
+        # Lowercased once per request (case-insensitive comparison)
+        email_text_lower = context.email_text_lower
+        text_length = context.text_length
+        
+        # Lookup from candidateid to keyword info, built once per request
+        candidate_map = context.candidate_map
         
-        # Build lookup map from candidateid to keyword info
-        candidate_map = {
-            candidate.candidate_id: {
-                "term": candidate.term,
-                "lemma": candidate.lemma
-            }
-            for candidate in request.candidate_keywords
-        }
+        # Presence per candidateid, computed once even if several topics reuse it
+        present: dict[str, bool] = {}
         
         for topic_idx, topic in enumerate(response.topics):
             for kw_idx, keyword in enumerate(topic.keywordsintext):
@@ -147,23 +251,27 @@ class KeywordPresenceVerifier:
                 # Get term and lemma from candidate
                 if candidate_id not in candidate_map:
                     # This should have been caught by Stage 3, but handle gracefully
-                    warnings.append(
+                    append(
                         f"Keyword candidateid '{candidate_id}' not in candidates "
                         f"(topic '{topic.labelid}', keyword index {kw_idx})"
                     )
                     continue
                 
                 candidate_info = candidate_map[candidate_id]
-                term = candidate_info["term"].lower()
-                lemma = candidate_info["lemma"].lower()
                 
                 # Check if term or lemma appears in text
-                term_found = term in email_text_lower
-                lemma_found = lemma in email_text_lower if lemma != term else term_found
+                found = present.get(candidate_id)
+                if found is None:
+                    term_lower = candidate_info.term_lower
+                    lemma_lower = candidate_info.lemma_lower
+                    found = present[candidate_id] = (
+                        term_lower in email_text_lower
+                        or (lemma_lower != term_lower and lemma_lower in email_text_lower)
+                    )
                 
-                if not term_found and not lemma_found:
-                    warnings.append(
-                        f"Keyword term '{candidate_info['term']}' / lemma '{candidate_info['lemma']}' "
+                if not found:
+                    append(
+                        f"Keyword term '{candidate_info.term}' / lemma '{candidate_info.lemma}' "
                         f"not found in email text (candidateid: {candidate_id}, "
                         f"topic '{topic.labelid}', keyword index {kw_idx})"
                     )
@@ -173,35 +281,35 @@ class KeywordPresenceVerifier:
                 if keyword.spans:
                     for span_idx, span in enumerate(keyword.spans):
                         if len(span) != 2:
-                            warnings.append(
-                                f"Invalid span format for keyword '{candidate_info['term']}': {span} "
+                            append(
+                                f"Invalid span format for keyword '{candidate_info.term}': {span} "
                                 f"(expected [start, end])"
                             )
                             continue
                         
                         start, end = span
-                        if not self._verify_span_bounds(email_text, start, end):
-                            warnings.append(
+                        if not self._verify_span_bounds(text_length, start, end):
+                            append(
                                 f"Keyword span [{start}:{end}] out of bounds for "
-                                f"'{candidate_info['term']}' (text length: {len(email_text)})"
+                                f"'{candidate_info.term}' (text length: {text_length})"
                             )
         
         return warnings
     
     @staticmethod
-    def _verify_span_bounds(text: str, start: int, end: int) -> bool:
+    def _verify_span_bounds(text_length: int, start: int, end: int) -> bool:
         """
         Verify that span [start:end] is within text bounds.
         
         Args:
-            text: Full email text
+            text_length: Length of the full email text
             start: Start index
             end: End index
             
         Returns:
             True if span is valid, False otherwise
         """
-        return 0 <= start < end <= len(text)
+        return 0 <= start < end <= text_length
 
 
 class SpansCoherenceVerifier:
@@ -214,77 +322,105 @@ class SpansCoherenceVerifier:
     - Spans are within text bounds
     """
     
-    def verify(self, response: EmailTriageResponse, request: TriageRequest) -> list[str]:
+    def verify(
+        self,
+        response: EmailTriageResponse,
+        request: TriageRequest,
+        context: VerificationContext | None = None
+    ) -> list[str]:
         """
         Check span coherence across all keywords and evidence.
         
         Args:
             response: LLM response with spans
             request: Original request with email document
+            context: Shared verification context (built from request if omitted)
             
         Returns:
             List of warnings for span issues
         """
         warnings: list[str] = []
+        append = warnings.append
         
-        email_text = request.email.body_text_canonical
-        text_length = len(email_text) if email_text else 0
+        if context is None:
+            context = VerificationContext.from_request(request)
         
-        # Check keyword spans
-        for topic_idx, topic in enumerate(response.topics):
-            for kw_idx, keyword in enumerate(topic.keywordsintext):
+        text_length = context.text_length
+        
+        check_span = self._check_span
+        
+        # Single pass over topics: keyword spans, then evidence spans
+        for topic in response.topics:
+            for keyword in topic.keywordsintext:
                 if keyword.spans:
-                    for span_idx, span in enumerate(keyword.spans):
-                        warning = self._check_span(
-                            span, text_length, 
-                            f"keyword '{keyword.lemma}' in topic '{topic.labelid}'"
+                    for span in keyword.spans:
+                        warning = check_span(
+                            span, text_length,
+                            _KEYWORD_SPAN_CONTEXT, keyword.lemma, topic.labelid
                         )
                         if warning:
-                            warnings.append(warning)
-        
-        # Check evidence spans
-        for topic_idx, topic in enumerate(response.topics):
-            for ev_idx, evidence in enumerate(topic.evidence):
+                            append(warning)
+            
+            for evidence in topic.evidence:
                 if evidence.span:
-                    warning = self._check_span(
+                    warning = check_span(
                         evidence.span, text_length,
-                        f"evidence in topic '{topic.labelid}'"
+                        _EVIDENCE_SPAN_CONTEXT, topic.labelid
                     )
                     if warning:
-                        warnings.append(warning)
+                        append(warning)
         
         return warnings
     
     @staticmethod
-    def _check_span(span: list[int], text_length: int, context: str) -> Optional[str]:
+    def _check_span(
+        span: list[int],
+        text_length: int,
+        context: str,
+        *context_args: object
+    ) -> Optional[str]:
         """
         Check if a single span is coherent.
         
         Args:
             span: [start, end] span array
             text_length: Length of the text being spanned
-            context: Description of where this span comes from (for error message)
+            context: Template describing where this span comes from (for error message)
+            *context_args: Values for the context template, formatted only on failure
             
         Returns:
             Warning message if span is invalid, None otherwise
         """
-        if not isinstance(span, (list, tuple)) or len(span) != 2:
-            return f"Invalid span format for {context}: {span} (expected [start, end])"        
-        start, end = span
+        # A 2-character string would unpack too: only lists/tuples are spans
+        if not isinstance(span, (list, tuple)):
+            context = context.format(*context_args)
+            return f"Invalid span format for {context}: {span} (expected [start, end])"
+        try:
+            start, end = span
+        except ValueError:
+            context = context.format(*context_args)
+            return f"Invalid span format for {context}: {span} (expected [start, end])"
         
-        if not isinstance(start, int) or not isinstance(end, int):
+        try:
+            start, end = _index(start), _index(end)
+        except TypeError:
+            context = context.format(*context_args)
             return f"Span indices must be integers for {context}: [{start}, {end}]"
         
+        # Happy path: one chained comparison; only diagnose when it fails
+        if 0 <= start < end <= text_length:
+            return None
+        
+        context = context.format(*context_args)
+        
         if start >= end:
             return f"Span start >= end for {context}: [{start}, {end}]"
         
         if start < 0:
             return f"Span start < 0 for {context}: [{start}, {end}]"
         
-        if end > text_length:
-            return f"Span end > text length for {context}: [{start}, {end}] (text length: {text_length})"
-        
-        return None
+        # Only remaining failure: end > text_length
+        return f"Span end > text length for {context}: [{start}, {end}] (text length: {text_length})"
 
 
 
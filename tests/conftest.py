@@ -59,9 +59,9 @@ def test_settings() -> Settings:
     )
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def fixtures_dir() -> Path:
-    """Path to test fixtures directory."""
+    """Path to test fixtures directory (independent of the working directory)."""
     return Path(__file__).parent / "fixtures"
 
 
@@ -53,19 +53,24 @@ async def check_async_redis():
 
 
 @pytest.fixture
-def real_ollama_client(check_ollama):
+async def real_ollama_client(check_ollama):
     """Real OllamaClient instance for integration tests.
     
     Requires Ollama to be running (checked by check_ollama fixture).
+    The httpx pool is closed on teardown, while the event loop is still alive.
     """
     from inference_layer.llm.ollama_client import OllamaClient
     
-    return OllamaClient(
+    client = OllamaClient(
         base_url="http://localhost:11434",
         model="qwen2.5:7b",
         timeout=60,
         max_retries=2,
     )
+    
+    yield client
+    
+    await client.close()
 
 
 @pytest.fixture
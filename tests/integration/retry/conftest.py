@@ -0,0 +1,122 @@
+"""Retry integration test fixtures.
+
+The expensive parts of the retry stack (httpx pool, prompt templates,
+JSON schema) are built once per session and shared by every test.
+Tests that need different retry settings build a fresh RetryEngine on
+top of them via ``make_retry_engine``.
+"""
+
+from pathlib import Path
+from typing import Callable, Iterable, Optional
+
+import httpx
+import pytest
+import pytest_asyncio
+
+from inference_layer.config import Settings
+from inference_layer.llm.ollama_client import OllamaClient
+from inference_layer.llm.prompt_builder import PromptBuilder
+from inference_layer.models.llm_models import LLMGenerationRequest, LLMGenerationResponse
+from inference_layer.retry.engine import RetryEngine
+from inference_layer.validation.pipeline import ValidationPipeline
+
+
+class MockLLMClient:
+    """Minimal LLM client that replays a scripted sequence of responses.
+
+    Once the sequence is exhausted, calls are delegated to ``fallback``
+    (e.g. the real OllamaClient) if one was given.
+    """
+
+    def __init__(
+        self,
+        responses: Iterable[LLMGenerationResponse],
+        fallback: Optional[OllamaClient] = None,
+    ):
+        self._responses = iter(responses)
+        self._fallback = fallback
+        self.calls = 0
+
+    async def generate(self, request: LLMGenerationRequest) -> LLMGenerationResponse:
+        self.calls += 1
+        response = next(self._responses, None)
+        if response is None:
+            if self._fallback is None:
+                raise AssertionError("MockLLMClient ran out of scripted responses")
+            return await self._fallback.generate(request)
+        return response
+
+    async def close(self) -> None:
+        pass
+
+
+@pytest.fixture(scope="session")
+def settings() -> Settings:
+    """Base settings shared by the retry integration tests (never mutated)."""
+    return Settings()
+
+
+@pytest_asyncio.fixture(scope="session", loop_scope="session")
+async def llm_client(check_ollama, settings: Settings):
+    """Real OllamaClient shared across tests (keeps the httpx pool warm).
+
+    Under pytest-xdist each worker gets its own client and pool.
+    """
+    client = OllamaClient(
+        base_url=settings.OLLAMA_BASE_URL,
+        model=settings.OLLAMA_MODEL,
+        timeout=settings.OLLAMA_TIMEOUT,
+        connection_limits=httpx.Limits(max_connections=8, max_keepalive_connections=8),
+    )
+    yield client
+    await client.close()
+
+
+@pytest.fixture(scope="session")
+def prompt_builder(settings: Settings) -> PromptBuilder:
+    """PromptBuilder with templates and schema loaded once."""
+    return PromptBuilder(
+        templates_dir=Path(settings.PROMPT_TEMPLATES_DIR),
+        schema_path=Path(settings.JSON_SCHEMA_PATH),
+        default_temperature=settings.LLM_TEMPERATURE,
+        default_max_tokens=settings.LLM_MAX_TOKENS,
+        body_truncation_limit=settings.BODY_TRUNCATION_LIMIT,
+        candidate_top_n=settings.CANDIDATE_TOP_N,
+        shrink_body_limit=settings.SHRINK_BODY_LIMIT,
+        shrink_top_n=settings.SHRINK_TOP_N,
+    )
+
+
+@pytest.fixture(scope="session")
+def validation_pipeline(settings: Settings) -> ValidationPipeline:
+    """ValidationPipeline with the JSON schema compiled once."""
+    return ValidationPipeline(settings)
+
+
+@pytest.fixture
+def make_retry_engine(
+    settings: Settings,
+    llm_client: OllamaClient,
+    prompt_builder: PromptBuilder,
+    validation_pipeline: ValidationPipeline,
+) -> Callable[..., RetryEngine]:
+    """Factory for RetryEngine instances with optional settings overrides.
+
+    Overrides are applied to a copy, so the shared settings stay untouched.
+    Pass ``client`` to run the engine against a MockLLMClient instead of
+    the shared OllamaClient.
+    Usage: ``make_retry_engine(MAX_RETRIES=1, FALLBACK_MODELS=[])``.
+    """
+    def _make(client: Optional[MockLLMClient] = None, **overrides) -> RetryEngine:
+        engine_settings = settings.model_copy(update=overrides) if overrides else settings
+        return RetryEngine(
+            client or llm_client, prompt_builder, validation_pipeline, engine_settings
+        )
+
+    return _make
+
+
+@pytest.fixture
+def retry_engine(make_retry_engine: Callable[..., RetryEngine]) -> RetryEngine:
+    """RetryEngine with default settings."""
+    return make_retry_engine()
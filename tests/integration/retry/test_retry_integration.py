@@ -7,35 +7,72 @@ pipeline to test the full retry flow. Requires Ollama server running.
 Run with: pytest tests/integration/retry/test_retry_integration.py -v
 """
 
+import asyncio
+import itertools
 import json
+import time
 from datetime import datetime
+from functools import lru_cache
 from pathlib import Path
 from unittest.mock import AsyncMock, patch
 
 import pytest
 
-from inference_layer.config import Settings
-from inference_layer.llm.ollama_client import OllamaClient
-from inference_layer.llm.prompt_builder import PromptBuilder
 from inference_layer.models.input_models import (
     CandidateKeyword,
     EmailDocument,
     InputPipelineVersion,
     TriageRequest,
 )
-from inference_layer.retry.engine import RetryEngine
+from inference_layer.models.llm_models import LLMGenerationResponse
 from inference_layer.retry.exceptions import RetryExhausted
-from inference_layer.validation.pipeline import ValidationPipeline
+
+from .conftest import MockLLMClient
 
 # Fixture directory
 FIXTURES_DIR = Path(__file__).parent.parent.parent / "fixtures"
 
+# Malformed LLM output, read once so the mocks do no file I/O on the event loop
+_INVALID_JSON_CONTENT = (FIXTURES_DIR / "invalid_json_response.json").read_text()
+
+# First-attempt response carrying the malformed JSON fixture
+_INVALID_JSON_RESPONSE = LLMGenerationResponse(
+    content=_INVALID_JSON_CONTENT,
+    model_version="test_model:1.0",
+    finish_reason="stop",
+    prompt_tokens=100,
+    completion_tokens=50,
+    total_tokens=150,
+    latency_ms=500,
+)
+
+# Schema-invalid LLM response, built once and returned on every mocked attempt
+_CANNED_INVALID_RESPONSE = LLMGenerationResponse(
+    content='{"invalid": "json", "missing_required_fields": true}',
+    model_version="test_model:1.0",
+    finish_reason="stop",
+    prompt_tokens=100,
+    completion_tokens=50,
+    total_tokens=150,
+    latency_ms=500,
+)
+
+
+# Concurrent requests per batch test (Ollama queues what it cannot serve in parallel)
+BATCH_SIZE = 8
+
+# Default email body for test requests
+BASE_BODY = (
+    "Ho bisogno di informazioni sul contratto che ho firmato la settimana scorsa. "
+    "Vorrei anche ricevere la fattura del mese precedente. Grazie."
+)
+
 
 # Test fixtures
 def create_test_email(body: str = None) -> EmailDocument:
     """Helper to create minimal EmailDocument for testing."""
     if body is None:
-        body = "Ho bisogno di informazioni sul contratto che ho firmato la settimana scorsa. Vorrei anche ricevere la fattura del mese precedente. Grazie."
+        body = BASE_BODY
     
     return EmailDocument(
         uid="test_uid_integration",
@@ -63,8 +100,13 @@ def create_test_email(body: str = None) -> EmailDocument:
     )
 
 
+@lru_cache(maxsize=None)
 def create_test_request(body: str = None, candidates_count: int = 20) -> TriageRequest:
-    """Helper to create TriageRequest for testing."""
+    """Helper to create TriageRequest for testing.
+    
+    Built once per (body, candidates_count) and shared between tests:
+    callers must not mutate the returned request.
+    """
     email = create_test_email(body)
     
     # Create realistic Italian keyword candidates
@@ -114,6 +156,11 @@ def create_test_request(body: str = None, candidates_count: int = 20) -> TriageR
     )
 
 
+async def run_batch(engine, requests: list[TriageRequest]) -> list[tuple]:
+    """Run requests concurrently through one engine, overlapping Ollama latency."""
+    return await asyncio.gather(*(engine.execute_with_retry(r) for r in requests))
+
+
 # ============================================================================
 # Integration Tests (Require Ollama Running)
 # ============================================================================
@@ -121,36 +168,13 @@ def create_test_request(body: str = None, candidates_count: int = 20) -> TriageR
 
 @pytest.mark.integration
 @pytest.mark.asyncio
-async def test_retry_engine_success_with_real_ollama(check_ollama):
+async def test_retry_engine_success_with_real_ollama(make_retry_engine):
     """
     Integration test: Full retry engine with real Ollama + validation.
     
     Requires: Ollama server running with qwen2.5:7b model
     """
-    settings = Settings()
-    settings.MAX_RETRIES = 2
-    
-    # Real components
-    llm_client = OllamaClient(
-        base_url=settings.OLLAMA_BASE_URL,
-        model=settings.OLLAMA_MODEL,
-        timeout=settings.OLLAMA_TIMEOUT,
-    )
-    
-    prompt_builder = PromptBuilder(
-        templates_dir=Path(settings.PROMPT_TEMPLATES_DIR),
-        schema_path=Path(settings.JSON_SCHEMA_PATH),
-        default_temperature=settings.LLM_TEMPERATURE,
-        default_max_tokens=settings.LLM_MAX_TOKENS,
-        body_truncation_limit=settings.BODY_TRUNCATION_LIMIT,
-        candidate_top_n=settings.CANDIDATE_TOP_N,
-        shrink_body_limit=settings.SHRINK_BODY_LIMIT,
-        shrink_top_n=settings.SHRINK_TOP_N,
-    )
-    
-    validation_pipeline = ValidationPipeline(settings)
-    
-    retry_engine = RetryEngine(llm_client, prompt_builder, validation_pipeline, settings)
+    retry_engine = make_retry_engine(MAX_RETRIES=2)
     
     # Execute
     request = create_test_request()
@@ -179,35 +203,13 @@ async def test_retry_engine_success_with_real_ollama(check_ollama):
 
 @pytest.mark.integration
 @pytest.mark.asyncio
-async def test_retry_engine_shrink_mode_with_real_ollama(check_ollama):
+async def test_retry_engine_shrink_mode_with_real_ollama(make_retry_engine):
     """
     Integration test: Verify shrink mode reduces prompt size.
     
     Requires: Ollama server running
     """
-    settings = Settings()
-    settings.MAX_RETRIES = 1  # Force faster escalation to shrink
-    
-    llm_client = OllamaClient(
-        base_url=settings.OLLAMA_BASE_URL,
-        model=settings.OLLAMA_MODEL,
-        timeout=settings.OLLAMA_TIMEOUT,
-    )
-    
-    prompt_builder = PromptBuilder(
-        templates_dir=Path(settings.PROMPT_TEMPLATES_DIR),
-        schema_path=Path(settings.JSON_SCHEMA_PATH),
-        default_temperature=settings.LLM_TEMPERATURE,
-        default_max_tokens=settings.LLM_MAX_TOKENS,
-        body_truncation_limit=settings.BODY_TRUNCATION_LIMIT,
-        candidate_top_n=settings.CANDIDATE_TOP_N,
-        shrink_body_limit=settings.SHRINK_BODY_LIMIT,
-        shrink_top_n=settings.SHRINK_TOP_N,
-    )
-    
-    validation_pipeline = ValidationPipeline(settings)
-    
-    retry_engine = RetryEngine(llm_client, prompt_builder, validation_pipeline, settings)
+    retry_engine = make_retry_engine(MAX_RETRIES=1)  # Force faster escalation to shrink
     
     # Create request with large body and many candidates
     long_body = "Test email. " * 1000  # ~12KB body
@@ -234,141 +236,59 @@ async def test_retry_engine_shrink_mode_with_real_ollama(check_ollama):
 
 @pytest.mark.integration
 @pytest.mark.asyncio
-async def test_retry_engine_with_invalid_json_fixture(check_ollama):
+async def test_retry_engine_with_invalid_json_fixture(make_retry_engine, llm_client):
     """
     Integration test: Use invalid JSON fixture to force retry.
     
     This simulates LLM generating malformed JSON that requires retry.
     """
-    settings = Settings()
-    settings.MAX_RETRIES = 2
-    
-    llm_client = OllamaClient(
-        base_url=settings.OLLAMA_BASE_URL,
-        model=settings.OLLAMA_MODEL,
-        timeout=settings.OLLAMA_TIMEOUT,
-    )
-    
-    prompt_builder = PromptBuilder(
-        templates_dir=Path(settings.PROMPT_TEMPLATES_DIR),
-        schema_path=Path(settings.JSON_SCHEMA_PATH),
-        default_temperature=settings.LLM_TEMPERATURE,
-        default_max_tokens=settings.LLM_MAX_TOKENS,
-        body_truncation_limit=settings.BODY_TRUNCATION_LIMIT,
-        candidate_top_n=settings.CANDIDATE_TOP_N,
-        shrink_body_limit=settings.SHRINK_BODY_LIMIT,
-        shrink_top_n=settings.SHRINK_TOP_N,
-    )
-    
-    validation_pipeline = ValidationPipeline(settings)
-    
-    retry_engine = RetryEngine(llm_client, prompt_builder, validation_pipeline, settings)
+    # Invalid JSON fixture on first attempt, then the real LLM on retry
+    mock_client = MockLLMClient([_INVALID_JSON_RESPONSE], fallback=llm_client)
+    retry_engine = make_retry_engine(client=mock_client, MAX_RETRIES=2)
     
     request = create_test_request()
     
-    # Mock LLM client to return invalid JSON on first attempt, then valid
-    call_count = 0
-    original_generate = llm_client.generate
-    
-    async def mock_generate_with_retry(req):
-        nonlocal call_count
-        call_count += 1
-        
-        if call_count == 1:
-            # Return invalid JSON fixture
-            from inference_layer.models.llm_models import LLMGenerationResponse
-            
-            invalid_fixture_path = FIXTURES_DIR / "invalid_json_response.json"
-            with open(invalid_fixture_path, "r") as f:
-                invalid_content = f.read()
-            
-            return LLMGenerationResponse(
-                content=invalid_content,
-                model_version="test_model:1.0",
-                finish_reason="stop",
-                prompt_tokens=100,
-                completion_tokens=50,
-                total_tokens=150,
-                latency_ms=500,
-            )
-        else:
-            # Call real LLM on retry
-            return await original_generate(req)
+    response, metadata, warnings = await retry_engine.execute_with_retry(request)
     
-    with patch.object(llm_client, "generate", side_effect=mock_generate_with_retry):
-        response, metadata, warnings = await retry_engine.execute_with_retry(request)
-        
-        # Verify retry happened
-        assert metadata.total_attempts >= 2
-        assert len(metadata.validation_failures) >= 1
-        print(f"\n✅ Retry after invalid JSON worked!")
-        print(f"   Total attempts: {metadata.total_attempts}")
-        print(f"   Validation failures: {len(metadata.validation_failures)}")
+    # Verify retry happened
+    assert mock_client.calls >= 2
+    assert metadata.total_attempts >= 2
+    assert len(metadata.validation_failures) >= 1
+    print(f"\n✅ Retry after invalid JSON worked!")
+    print(f"   Total attempts: {metadata.total_attempts}")
+    print(f"   Validation failures: {len(metadata.validation_failures)}")
 
 
 @pytest.mark.integration
 @pytest.mark.asyncio
-async def test_retry_engine_all_strategies_exhausted(check_ollama):
+async def test_retry_engine_all_strategies_exhausted(make_retry_engine):
     """
     Integration test: Force all strategies to fail and verify RetryExhausted.
     
     This tests DLQ routing behavior.
     """
-    settings = Settings()
-    settings.MAX_RETRIES = 1
-    settings.FALLBACK_MODELS = []  # No fallback to speed up test
-    
-    llm_client = OllamaClient(
-        base_url=settings.OLLAMA_BASE_URL,
-        model=settings.OLLAMA_MODEL,
-        timeout=settings.OLLAMA_TIMEOUT,
-    )
-    
-    prompt_builder = PromptBuilder(
-        templates_dir=Path(settings.PROMPT_TEMPLATES_DIR),
-        schema_path=Path(settings.JSON_SCHEMA_PATH),
-        default_temperature=settings.LLM_TEMPERATURE,
-        default_max_tokens=settings.LLM_MAX_TOKENS,
-        body_truncation_limit=settings.BODY_TRUNCATION_LIMIT,
-        candidate_top_n=settings.CANDIDATE_TOP_N,
-        shrink_body_limit=settings.SHRINK_BODY_LIMIT,
-        shrink_top_n=settings.SHRINK_TOP_N,
+    # Mock LLM to always return invalid JSON
+    retry_engine = make_retry_engine(
+        client=MockLLMClient(itertools.repeat(_CANNED_INVALID_RESPONSE)),
+        MAX_RETRIES=1,
+        FALLBACK_MODELS=[],  # No fallback to speed up test
     )
     
-    validation_pipeline = ValidationPipeline(settings)
-    
-    retry_engine = RetryEngine(llm_client, prompt_builder, validation_pipeline, settings)
-    
     request = create_test_request()
     
-    # Mock LLM to always return invalid JSON
-    from inference_layer.models.llm_models import LLMGenerationResponse
+    with pytest.raises(RetryExhausted) as exc_info:
+        await retry_engine.execute_with_retry(request)
     
-    async def mock_always_invalid(req):
-        return LLMGenerationResponse(
-            content='{"invalid": "json", "missing_required_fields": true}',
-            model_version="test_model:1.0",
-            finish_reason="stop",
-            prompt_tokens=100,
-            completion_tokens=50,
-            total_tokens=150,
-            latency_ms=500,
-        )
+    # Verify RetryExhausted details
+    assert exc_info.value.request == request
+    assert exc_info.value.retry_metadata.total_attempts >= 3  # 1 standard + 2 shrink
+    assert len(exc_info.value.retry_metadata.strategies_used) >= 2
+    assert len(exc_info.value.retry_metadata.validation_failures) >= 3
     
-    with patch.object(llm_client, "generate", side_effect=mock_always_invalid):
-        with pytest.raises(RetryExhausted) as exc_info:
-            await retry_engine.execute_with_retry(request)
-        
-        # Verify RetryExhausted details
-        assert exc_info.value.request == request
-        assert exc_info.value.retry_metadata.total_attempts >= 3  # 1 standard + 2 shrink
-        assert len(exc_info.value.retry_metadata.strategies_used) >= 2
-        assert len(exc_info.value.retry_metadata.validation_failures) >= 3
-        
-        print(f"\n✅ RetryExhausted raised correctly!")
-        print(f"   Total attempts: {exc_info.value.retry_metadata.total_attempts}")
-        print(f"   Strategies: {exc_info.value.retry_metadata.strategies_used}")
-        print(f"   Failures: {len(exc_info.value.retry_metadata.validation_failures)}")
+    print(f"\n✅ RetryExhausted raised correctly!")
+    print(f"   Total attempts: {exc_info.value.retry_metadata.total_attempts}")
+    print(f"   Strategies: {exc_info.value.retry_metadata.strategies_used}")
+    print(f"   Failures: {len(exc_info.value.retry_metadata.validation_failures)}")
 
 
 # ============================================================================
@@ -378,41 +298,20 @@ async def test_retry_engine_all_strategies_exhausted(check_ollama):
 
 @pytest.mark.integration
 @pytest.mark.asyncio
-async def test_retry_engine_latency_tracking(check_ollama):
+async def test_retry_engine_latency_tracking(retry_engine):
     """Integration test: Verify latency tracking is accurate."""
-    settings = Settings()
-    
-    llm_client = OllamaClient(
-        base_url=settings.OLLAMA_BASE_URL,
-        model=settings.OLLAMA_MODEL,
-        timeout=settings.OLLAMA_TIMEOUT,
-    )
-    
-    prompt_builder = PromptBuilder(
-        templates_dir=Path(settings.PROMPT_TEMPLATES_DIR),
-        schema_path=Path(settings.JSON_SCHEMA_PATH),
-        default_temperature=settings.LLM_TEMPERATURE,
-        default_max_tokens=settings.LLM_MAX_TOKENS,
-        body_truncation_limit=settings.BODY_TRUNCATION_LIMIT,
-        candidate_top_n=settings.CANDIDATE_TOP_N,
-        shrink_body_limit=settings.SHRINK_BODY_LIMIT,
-        shrink_top_n=settings.SHRINK_TOP_N,
-    )
-    
-    validation_pipeline = ValidationPipeline(settings)
-    
-    retry_engine = RetryEngine(llm_client, prompt_builder, validation_pipeline, settings)
-    
     request = create_test_request()
     
-    import time
-    start_time = time.time()
+    start_ns = time.perf_counter_ns()
     response, metadata, warnings = await retry_engine.execute_with_retry(request)
-    actual_elapsed_ms = (time.time() - start_time) * 1000
+    actual_elapsed_ms = (time.perf_counter_ns() - start_ns) / 1_000_000
     
-    # Verify latency tracking is reasonable (within 20% of actual)
+    # The tracked latency is measured inside the call, so it cannot exceed the
+    # elapsed time around it; it must also cover nearly all of it (5% for the
+    # work outside the tracked window). The engine truncates wall-clock
+    # readings to whole milliseconds, hence 5ms of absolute slack on each side.
     assert metadata.total_latency_ms > 0
-    assert 0.8 * actual_elapsed_ms <= metadata.total_latency_ms <= 1.2 * actual_elapsed_ms
+    assert actual_elapsed_ms * 0.95 - 5 <= metadata.total_latency_ms <= actual_elapsed_ms + 5
     
     print(f"\n✅ Latency tracking accurate!")
     print(f"   Tracked: {metadata.total_latency_ms}ms")
@@ -420,6 +319,34 @@ async def test_retry_engine_latency_tracking(check_ollama):
     print(f"   LLM latency: {metadata.llm_metadata.latency_ms}ms")
 
 
+@pytest.mark.integration
+@pytest.mark.asyncio
+async def test_retry_engine_concurrent_batch(retry_engine):
+    """Integration test: Concurrent requests through one shared engine."""
+    # Distinct bodies, so Ollama cannot answer repeats from its prompt cache
+    requests = [create_test_request(body=f"{BASE_BODY} #{i}") for i in range(BATCH_SIZE)]
+    
+    start_ns = time.perf_counter_ns()
+    results = await run_batch(retry_engine, requests)
+    batch_elapsed_ms = (time.perf_counter_ns() - start_ns) / 1_000_000
+    
+    assert len(results) == BATCH_SIZE
+    for response, metadata, warnings in results:
+        assert response is not None
+        assert response.dictionaryversion == 1
+        # Each request is tracked on its own, never longer than the whole batch
+        assert 0 < metadata.total_latency_ms <= 1.2 * batch_elapsed_ms
+    
+    # Requests overlapped: the batch took less than running them back to back
+    total_tracked_ms = sum(metadata.total_latency_ms for _, metadata, _ in results)
+    assert batch_elapsed_ms < total_tracked_ms
+    
+    print(f"\n✅ Concurrent batch completed!")
+    print(f"   Requests: {BATCH_SIZE}")
+    print(f"   Batch wall time: {batch_elapsed_ms:.0f}ms")
+    print(f"   Sum of tracked latencies: {total_tracked_ms}ms")
+
+
 # ============================================================================
 # Skip Marker for CI
 # ============================================================================
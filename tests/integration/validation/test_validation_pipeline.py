@@ -7,7 +7,8 @@ and verifiers together.
 
 import json
 import pytest
-from pathlib import Path
+
+from structlog.testing import capture_logs
 
 from inference_layer.config import Settings
 from inference_layer.models.input_models import (
@@ -25,72 +26,87 @@ from inference_layer.validation import (
 )
 
 
+# Fixture files are read and turned into models once per session:
+# tests must not mutate them (use model_copy for variants).
+
+
+@pytest.fixture(scope="session")
+def settings():
+    """Create settings for validation pipeline."""
+    return Settings()
+
+
+@pytest.fixture(scope="session")
+def pipeline(settings):
+    """Create validation pipeline instance (schema compiled once per session)."""
+    return ValidationPipeline(settings)
+
+
+@pytest.fixture(scope="session")
+def disabled_verifiers_pipeline(settings):
+    """Pipeline with evidence/keyword verifiers turned off (settings copied, not rebuilt)."""
+    disabled_settings = settings.model_copy(update={
+        "ENABLE_EVIDENCE_PRESENCE_CHECK": False,
+        "ENABLE_KEYWORD_PRESENCE_CHECK": False,
+    })
+    return ValidationPipeline(disabled_settings)
+
+
+@pytest.fixture(scope="session")
+def sample_email_doc(fixtures_dir):
+    """Load sample email document from fixture."""
+    data = json.loads((fixtures_dir / "sample_email.json").read_bytes())
+    return EmailDocument(**data)
+
+
+@pytest.fixture(scope="session")
+def sample_candidates(fixtures_dir):
+    """Load sample candidate keywords from fixture."""
+    data = json.loads((fixtures_dir / "sample_candidates.json").read_bytes())
+
+    return [
+        CandidateKeyword(
+            candidate_id=c["candidate_id"],
+            term=c["term"],
+            lemma=c["lemma"],
+            count=c["count"],
+            source=c["source"],
+            score=c["score"]
+        )
+        for c in data
+    ]
+
+
+@pytest.fixture(scope="session")
+def sample_request(sample_email_doc, sample_candidates):
+    """Create sample TriageRequest."""
+    return TriageRequest(
+        email=sample_email_doc,
+        candidate_keywords=sample_candidates,
+        dictionary_version=1
+    )
+
+
+@pytest.fixture(scope="session")
+def valid_llm_response_content(fixtures_dir):
+    """Load valid LLM response JSON string from fixture."""
+    return (fixtures_dir / "valid_llm_response.json").read_text(encoding="utf-8")
+
+
+@pytest.fixture(scope="session")
+def valid_llm_response(valid_llm_response_content):
+    """Create LLMGenerationResponse with valid content."""
+    return LLMGenerationResponse(
+        content=valid_llm_response_content,
+        model_version="test_model:1.0",
+        finish_reason="stop",
+        latency_ms=1234,
+    )
+
+
 class TestValidationPipelineIntegration:
     """Integration tests for full validation pipeline."""
     
-    @pytest.fixture
-    def settings(self):
-        """Create settings for validation pipeline."""
-        return Settings()
-    
-    @pytest.fixture
-    def pipeline(self, settings):
-        """Create validation pipeline instance."""
-        return ValidationPipeline(settings)
-    
-    @pytest.fixture
-    def sample_email_doc(self):
-        """Load sample email document from fixture."""
-        fixture_path = Path("tests/fixtures/sample_email.json")
-        with open(fixture_path, "r", encoding="utf-8") as f:
-            data = json.load(f)
-        return EmailDocument(**data)
-    
-    @pytest.fixture
-    def sample_candidates(self):
-        """Load sample candidate keywords from fixture."""
-        fixture_path = Path("tests/fixtures/sample_candidates.json")
-        with open(fixture_path, "r", encoding="utf-8") as f:
-            data = json.load(f)
-        
-        return [
-            CandidateKeyword(
-                candidate_id=c["candidate_id"],
-                term=c["term"],
-                lemma=c["lemma"],
-                count=c["count"],
-                source=c["source"],
-                score=c["score"]
-            )
-            for c in data
-        ]
-    
-    @pytest.fixture
-    def sample_request(self, sample_email_doc, sample_candidates):
-        """Create sample TriageRequest."""
-        return TriageRequest(
-            email=sample_email_doc,
-            candidate_keywords=sample_candidates,
-            dictionary_version=1
-        )
-    
-    @pytest.fixture
-    def valid_llm_response_content(self):
-        """Load valid LLM response JSON string from fixture."""
-        fixture_path = Path("tests/fixtures/valid_llm_response.json")
-        with open(fixture_path, "r", encoding="utf-8") as f:
-            return f.read()
-    
-    @pytest.fixture
-    def valid_llm_response(self, valid_llm_response_content):
-        """Create LLMGenerationResponse with valid content."""
-        return LLMGenerationResponse(
-            content=valid_llm_response_content,
-            model_version="test_model:1.0",
-            finish_reason="stop",
-            latency_ms=1234,
-        )
-    
     @pytest.mark.asyncio
     async def test_valid_response_full_pipeline_success(
         self,
@@ -347,43 +363,54 @@ class TestValidationPipelineIntegration:
             assert len(warnings) >= 1
             assert any("not found in email text" in w for w in warnings)
     
+    @pytest.mark.asyncio
+    async def test_empty_body_skips_verifiers_with_single_warning(
+        self,
+        pipeline,
+        valid_llm_response,
+        sample_request
+    ):
+        """Test that an empty body produces one warning instead of one per verifier."""
+        empty_body_request = sample_request.model_copy(
+            update={
+                "email": sample_request.email.model_copy(update={"body_text_canonical": ""})
+            }
+        )
+        
+        response, warnings = await pipeline.validate(valid_llm_response, empty_body_request)
+        
+        assert response is not None
+        empty_body_warnings = [w for w in warnings if "body_text_canonical is empty" in w]
+        assert empty_body_warnings == ["Email body_text_canonical is empty, verifiers skipped"]
+    
     @pytest.mark.asyncio
     async def test_all_stages_and_verifiers_log_correctly(
         self,
         pipeline,
         valid_llm_response,
         sample_request,
-        caplog
     ):
         """Test that all stages and verifiers log their execution."""
-        import logging
-        caplog.set_level(logging.DEBUG)
-        
-        response, warnings = await pipeline.validate(valid_llm_response, sample_request)
+        # Captures structlog event dicts without touching the global logging setup
+        with capture_logs() as events:
+            response, warnings = await pipeline.validate(valid_llm_response, sample_request)
         
         # Check that stages logged execution
-        assert any("Stage 1" in record.message for record in caplog.records)
-        assert any("Stage 2" in record.message for record in caplog.records)
-        assert any("Stage 3" in record.message for record in caplog.records)
-        assert any("Stage 4" in record.message for record in caplog.records)
-        assert any("verifiers" in record.message.lower() for record in caplog.records)
+        assert {event["stage"] for event in events if "stage" in event} >= {1, 2, 3, 4}
+        assert any(event.get("verifiers") for event in events)
     
     @pytest.mark.asyncio
     async def test_pipeline_with_disabled_verifiers(
         self,
+        disabled_verifiers_pipeline,
         sample_request,
         valid_llm_response
     ):
         """Test that pipeline works with verifiers disabled."""
-        # Create settings with verifiers disabled
-        settings = Settings(
-            ENABLE_EVIDENCE_PRESENCE_CHECK=False,
-            ENABLE_KEYWORD_PRESENCE_CHECK=False
-        )
-        pipeline = ValidationPipeline(settings)
-        
         # Should still work, just with fewer verifiers
-        response, warnings = await pipeline.validate(valid_llm_response, sample_request)
+        response, warnings = await disabled_verifiers_pipeline.validate(
+            valid_llm_response, sample_request
+        )
         
         assert response is not None
         # Span coherence verifier always runs, but evidence/keyword may not
@@ -2,10 +2,11 @@
 Unit tests for API response models.
 """
 
-from datetime import datetime
+from datetime import datetime, timezone
 
 import pytest
-from pydantic import ValidationError
+from pydantic import TypeAdapter, ValidationError
+from pydantic_core import to_json
 
 from inference_layer.api.models import (
     BatchSubmitRequest,
@@ -19,43 +20,53 @@ from inference_layer.api.models import (
 from inference_layer.models.output_models import TriageResult
 
 
+# Fixed timestamp: deterministic results without a clock read per test
+FIXED_CREATED_AT = datetime(2026, 1, 1, 12, 0, tzinfo=timezone.utc).isoformat()
+
+# Minimal TriageResult payload shared by the response model tests (read-only)
+BASE_RESULT_DICT: dict = {
+    "triage_response": {
+        "dictionaryversion": 1,
+        "sentiment": {"value": "neutral", "confidence": 0.8},
+        "priority": {"value": "medium", "confidence": 0.7, "signals": []},
+        "topics": [
+            {
+                "labelid": "INFOCOMMERCIALI",
+                "confidence": 0.9,
+                "keywordsintext": [
+                    {"candidateid": "hash_001", "lemma": "info", "count": 1}
+                ],
+                "evidence": [{"quote": "informazioni"}]
+            }
+        ]
+    },
+    "pipeline_version": {
+        "dictionary_version": 1,
+        "model_version": "qwen2.5:7b",
+        "schema_version": "email_triage_v2",
+        "inference_layer_version": "0.1.0",
+        "parser_version": "1.0",
+        "canonicalization_version": "1.0",
+        "ner_model_version": "1.0",
+        "pii_redaction_version": "1.0"
+    },
+    "request_uid": "test_uid",
+    "validation_warnings": [],
+    "retries_used": 0,
+    "processing_duration_ms": 1500,
+    "created_at": FIXED_CREATED_AT
+}
+
+# Serialized once; the tests validate straight from JSON bytes, as the
+# repository does when reading persisted results
+BASE_RESULT_JSON: bytes = to_json(BASE_RESULT_DICT)
+
+_TRIAGE_RESULT_ADAPTER = TypeAdapter(TriageResult)
+
+
 def test_triage_response_model():
     """Test TriageResponse model validation."""
-    # Create a mock TriageResult (simplified for testing)
-    result_dict = {
-        "triage_response": {
-            "dictionaryversion": 1,
-            "sentiment": {"value": "neutral", "confidence": 0.8},
-            "priority": {"value": "medium", "confidence": 0.7, "signals": []},
-            "topics": [
-                {
-                    "labelid": "INFOCOMMERCIALI",
-                    "confidence": 0.9,
-                    "keywordsintext": [
-                        {"candidateid": "hash_001", "lemma": "info", "count": 1}
-                    ],
-                    "evidence": [{"quote": "informazioni"}]
-                }
-            ]
-        },
-        "pipeline_version": {
-            "dictionary_version": 1,
-            "model_version": "qwen2.5:7b",
-            "schema_version": "email_triage_v2",
-            "inference_layer_version": "0.1.0",
-            "parser_version": "1.0",
-            "canonicalization_version": "1.0",
-            "ner_model_version": "1.0",
-            "pii_redaction_version": "1.0"
-        },
-        "request_uid": "test_uid",
-        "validation_warnings": [],
-        "retries_used": 0,
-        "processing_duration_ms": 1500,
-        "created_at": datetime.utcnow().isoformat()
-    }
-    
-    result = TriageResult.model_validate(result_dict)
+    result = _TRIAGE_RESULT_ADAPTER.validate_json(BASE_RESULT_JSON)
     
     response = TriageResponse(
         status="success",
@@ -99,40 +110,7 @@ def test_batch_submit_response():
 
 def test_task_status_response_success():
     """Test TaskStatusResponse for successful task."""
-    result_dict = {
-        "triage_response": {
-            "dictionaryversion": 1,
-            "sentiment": {"value": "neutral", "confidence": 0.8},
-            "priority": {"value": "medium", "confidence": 0.7, "signals": []},
-            "topics": [
-                {
-                    "labelid": "INFOCOMMERCIALI",
-                    "confidence": 0.9,
-                    "keywordsintext": [
-                        {"candidateid": "hash_001", "lemma": "info", "count": 1}
-                    ],
-                    "evidence": [{"quote": "informazioni"}]
-                }
-            ]
-        },
-        "pipeline_version": {
-            "dictionary_version": 1,
-            "model_version": "qwen2.5:7b",
-            "schema_version": "email_triage_v2",
-            "inference_layer_version": "0.1.0",
-            "parser_version": "1.0",
-            "canonicalization_version": "1.0",
-            "ner_model_version": "1.0",
-            "pii_redaction_version": "1.0"
-        },
-        "request_uid": "test_uid",
-        "validation_warnings": [],
-        "retries_used": 0,
-        "processing_duration_ms": 1500,
-        "created_at": datetime.utcnow().isoformat()
-    }
-    
-    result = TriageResult.model_validate(result_dict)
+    result = _TRIAGE_RESULT_ADAPTER.validate_json(BASE_RESULT_JSON)
     
     response = TaskStatusResponse(
         task_id="task_123",
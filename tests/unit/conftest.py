@@ -5,14 +5,29 @@ Provides mock objects for testing without external dependencies.
 
 import pytest
 from unittest.mock import Mock, AsyncMock
-from datetime import datetime
 
 from inference_layer.models.llm_models import (
     ChatMessage,
     LLMGenerationRequest,
-    LLMGenerationResponse,
     LLMMetadata,
 )
+from inference_layer.models.output_models import EmailTriageResponse
+from inference_layer.retry.metadata import RetryMetadata
+
+
+def _minimal_triage_response() -> EmailTriageResponse:
+    """Minimal valid EmailTriageResponse (one topic) for mock return values."""
+    return EmailTriageResponse(
+        dictionaryversion=1,
+        topics=[{
+            "labelid": "CONTRATTO",
+            "confidence": 0.9,
+            "keywordsintext": [{"candidateid": "hash_001", "lemma": "contratto", "count": 1}],
+            "evidence": [{"quote": "contratto"}],
+        }],
+        sentiment={"value": "neutral", "confidence": 0.8},
+        priority={"value": "medium", "confidence": 0.7, "signals": []},
+    )
 
 
 @pytest.fixture
@@ -49,65 +64,15 @@ def mock_async_redis():
     return mock
 
 
-@pytest.fixture
-def mock_llm_response():
-    """Mock LLMGenerationResponse for validation tests."""
-    return LLMGenerationResponse(
-        content='{"dictionaryversion": 1, "topics": [], "sentiment": {"value": "neutral", "confidence": 0.8}, "priority": {"value": "medium", "confidence": 0.7, "signals": []}}',
-        model_version="qwen2.5:7b",
-        finish_reason="stop",
-        usage_tokens=750,
-        prompt_tokens=500,
-        completion_tokens=250,
-        latency_ms=1500,
-        created_at=datetime.now().isoformat(),
-        raw_metadata={},
-    )
-
-
-@pytest.fixture
-def mock_ollama_client():
-    """Mock OllamaClient for unit tests."""
-    mock = AsyncMock()
-    
-    # Mock generate method
-    mock.generate = AsyncMock(return_value=LLMGenerationResponse(
-        content='{"dictionaryversion": 1, "topics": [{"labelid": "FATTURAZIONE", "confidence": 0.9, "keywordsintext": [{"candidateid": "hash_001", "lemma": "fattura", "count": 1}], "evidence": [{"quote": "test quote"}]}], "sentiment": {"value": "neutral", "confidence": 0.8}, "priority": {"value": "medium", "confidence": 0.7, "signals": []}}',
-        model_version="qwen2.5:7b",
-        finish_reason="stop",
-        usage_tokens=750,
-        prompt_tokens=500,
-        completion_tokens=250,
-        latency_ms=1500,
-        created_at=datetime.now().isoformat(),
-        raw_metadata={},
-    ))
-    
-    # Mock health_check method
-    mock.health_check = AsyncMock(return_value=True)
-    
-    # Mock list_models method
-    mock.list_models = AsyncMock(return_value=["qwen2.5:7b", "llama3.1:8b"])
-    
-    return mock
-
-
 @pytest.fixture
 def mock_validation_pipeline():
     """Mock ValidationPipeline for unit tests."""
     mock = AsyncMock()
     
-    # Mock validate method returns (response, warnings)
-    from inference_layer.models.output_models import EmailTriageResponse
-    
-    async def mock_validate(llm_response, request):
-        # Return a minimal valid response with no warnings
-        import json
-        content = json.loads(llm_response.content)
-        response = EmailTriageResponse(**content)
-        return response, []
-    
-    mock.validate = AsyncMock(side_effect=mock_validate)
+    # Mock validate method returns (response, warnings): a minimal valid
+    # response with no warnings. Tests needing per-input behaviour can set
+    # mock.validate.side_effect themselves.
+    mock.validate = AsyncMock(return_value=(_minimal_triage_response(), []))
     
     return mock
 
@@ -156,34 +121,25 @@ def mock_retry_engine():
     """Mock RetryEngine for unit tests."""
     mock = AsyncMock()
     
-    from inference_layer.models.output_models import EmailTriageResponse
-    from inference_layer.retry.metadata import RetryMetadata
-    from inference_layer.models.llm_models import LLMMetadata
-    
-    async def mock_execute(request):
-        # Return minimal valid response, metadata, warnings
-        response = EmailTriageResponse(
-            dictionaryversion=1,
-            topics=[],
-            sentiment={"value": "neutral", "confidence": 0.8},
-            priority={"value": "medium", "confidence": 0.7, "signals": []},
-        )
-        metadata = RetryMetadata(
-            total_attempts=1,
-            strategies_used=["standard"],
-            final_strategy="standard",
-            total_latency_ms=1500,
-            llm_metadata=LLMMetadata(
-                model="qwen2.5:7b",
-                prompt_token_count=500,
-                completion_token_count=250,
-                generation_latency_ms=1500,
-            ),
-            validation_failures=[],
-        )
-        warnings = []
-        return response, metadata, warnings
-    
-    mock.execute_with_retry = AsyncMock(side_effect=mock_execute)
+    # execute_with_retry returns (response, metadata, warnings), built once
+    metadata = RetryMetadata(
+        total_attempts=1,
+        strategies_used=["standard"],
+        final_strategy="standard",
+        total_latency_ms=1500,
+        llm_metadata=LLMMetadata(
+            model="qwen2.5:7b",
+            model_version="qwen2.5:7b",
+            temperature=0.1,
+            tokens_used=750,
+            latency_ms=1500,
+            finish_reason="stop",
+            candidates_count=10,
+        ),
+        validation_failures=[],
+    )
+    mock.execute_with_retry = AsyncMock(
+        return_value=(_minimal_triage_response(), metadata, [])
+    )
     
     return mock
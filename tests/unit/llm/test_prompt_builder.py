@@ -11,9 +11,23 @@ from inference_layer.models.input_models import (
 )
 
 
-@pytest.fixture
+# Extra low-score candidates for top-N selection tests (built once, read-only)
+EXTRA_CANDIDATES = [
+    CandidateKeyword(
+        candidate_id=f"kw_{i:03d}",
+        term=f"term{i}",
+        lemma=f"lemma{i}",
+        count=1,
+        source="body",
+        score=float(i)
+    )
+    for i in range(20)
+]
+
+
+@pytest.fixture(scope="session")
 def sample_email_document():
-    """Sample email document for testing."""
+    """Sample email document for testing (shared: do not mutate)."""
     return EmailDocument(
         uid="test-123",
         uidvalidity="12345",
@@ -47,9 +61,9 @@ def sample_email_document():
     )
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def sample_candidates():
-    """Sample candidate keywords."""
+    """Sample candidate keywords (shared: do not mutate)."""
     return [
         CandidateKeyword(
             candidate_id="kw_001",
@@ -70,9 +84,9 @@ def sample_candidates():
     ]
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def triage_request(sample_email_document, sample_candidates):
-    """Sample triage request."""
+    """Sample triage request (shared: do not mutate)."""
     return TriageRequest(
         email=sample_email_document,
         candidate_keywords=sample_candidates,
@@ -82,10 +96,18 @@ def triage_request(sample_email_document, sample_candidates):
 
 
 @pytest.fixture
-def prompt_builder(tmp_path):
-    """Create prompt builder with test templates."""
+def triage_request_mut(triage_request):
+    """Per-test deep copy of triage_request for tests that mutate it."""
+    return triage_request.model_copy(deep=True)
+
+
+@pytest.fixture(scope="session")
+def prompt_files(tmp_path_factory):
+    """Write test templates and schema once; returns (templates_dir, schema_path)."""
+    base_dir = tmp_path_factory.mktemp("prompt_builder")
+    
     # Create temporary templates
-    templates_dir = tmp_path / "prompts"
+    templates_dir = base_dir / "prompts"
     templates_dir.mkdir()
     
     # System prompt
@@ -114,10 +136,16 @@ CANDIDATE KEYWORDS:
     (templates_dir / "user_prompt_template.txt").write_text(user_template, encoding="utf-8")
     
     # Create minimal JSON schema
-    schema_path = tmp_path / "schema.json"
+    schema_path = base_dir / "schema.json"
     schema = {"type": "object", "properties": {"dictionaryversion": {"type": "integer"}}}
     schema_path.write_text(json.dumps(schema), encoding="utf-8")
     
+    return templates_dir, schema_path
+
+
+def _make_prompt_builder(prompt_files, redact_for_llm=False):
+    """Build a PromptBuilder over the shared test templates."""
+    templates_dir, schema_path = prompt_files
     return PromptBuilder(
         templates_dir=templates_dir,
         schema_path=schema_path,
@@ -125,13 +153,25 @@ CANDIDATE KEYWORDS:
         shrink_body_limit=50,
         candidate_top_n=10,
         shrink_top_n=5,
-        redact_for_llm=False,
+        redact_for_llm=redact_for_llm,
         default_model="test-model",
         default_temperature=0.1,
         default_max_tokens=100
     )
 
 
+@pytest.fixture(scope="session")
+def prompt_builder(prompt_files):
+    """Create prompt builder with test templates (shared: do not mutate)."""
+    return _make_prompt_builder(prompt_files)
+
+
+@pytest.fixture(scope="session")
+def prompt_builder_redacted(prompt_files):
+    """Prompt builder with PII redaction enabled."""
+    return _make_prompt_builder(prompt_files, redact_for_llm=True)
+
+
 class TestPromptBuilder:
     """Test PromptBuilder functionality."""
     
@@ -159,27 +199,40 @@ class TestPromptBuilder:
         assert metadata["candidates_count"] == 2
         assert not metadata["truncation_applied"]  # Body is short
     
-    def test_build_user_prompt_shrink_mode(self, prompt_builder, triage_request):
-        """Should use shrink limits in shrink mode."""
-        user_prompt, metadata = prompt_builder.build_user_prompt(
-            triage_request, shrink_mode=True
-        )
-        
-        assert metadata["shrink_mode"] is True
-        # Body should be truncated to 50 chars in shrink mode
-        assert metadata["truncated_body_length"] <= 50
-    
-    def test_build_user_prompt_truncates_long_body(self, prompt_builder, triage_request):
-        """Should truncate body exceeding limit."""
-        # Make body very long
-        triage_request.email.body_text_canonical = "A" * 200 + ". " + "B" * 200
+    @pytest.mark.parametrize(
+        "shrink_mode,long_body,extra_candidates,body_cap,candidates_cap",
+        [
+            (True, False, 0, 50, 2),
+            (False, True, 0, 100, 2),
+            (False, False, 20, 100, 10),
+            (True, False, 20, 50, 5),
+        ],
+        ids=["shrink_mode", "truncates_long_body", "top_n_normal", "top_n_shrink"],
+    )
+    def test_build_user_prompt_limits(
+        self,
+        prompt_builder,
+        triage_request_mut,
+        shrink_mode,
+        long_body,
+        extra_candidates,
+        body_cap,
+        candidates_cap,
+    ):
+        """Should apply body truncation and top-N candidate limits for the mode."""
+        if long_body:
+            triage_request_mut.email.body_text_canonical = "A" * 200 + ". " + "B" * 200
+        triage_request_mut.candidate_keywords.extend(EXTRA_CANDIDATES[:extra_candidates])
         
         user_prompt, metadata = prompt_builder.build_user_prompt(
-            triage_request, shrink_mode=False
+            triage_request_mut, shrink_mode=shrink_mode
         )
         
-        assert metadata["truncation_applied"]
-        assert metadata["truncated_body_length"] <= 100
+        assert metadata["shrink_mode"] is shrink_mode
+        assert metadata["truncated_body_length"] <= body_cap
+        assert metadata["candidates_count"] == candidates_cap
+        if long_body:
+            assert metadata["truncation_applied"]
     
     def test_build_full_request(self, prompt_builder, triage_request):
         """Should build complete LLMGenerationRequest with messages[]."""
@@ -209,40 +262,10 @@ class TestPromptBuilder:
         assert metadata["schema_included"]
         assert metadata["total_messages_length"] > 0
     
-    def test_pii_redaction_when_enabled(self, prompt_builder, triage_request):
+    def test_pii_redaction_when_enabled(self, prompt_builder_redacted, triage_request):
         """Should apply PII redaction when enabled."""
-        prompt_builder.redact_for_llm = True
-        
-        user_prompt, metadata = prompt_builder.build_user_prompt(triage_request)
+        user_prompt, metadata = prompt_builder_redacted.build_user_prompt(triage_request)
         
         assert metadata["pii_redaction_applied"]
         # Email in body should be redacted (if span is correct)
         # This test might need adjustment based on actual PII span positions
-    
-    def test_top_n_candidate_selection(self, prompt_builder, triage_request):
-        """Should limit candidates to top-N."""
-        # Add many candidates
-        for i in range(20):
-            triage_request.candidate_keywords.append(
-                CandidateKeyword(
-                    candidate_id=f"kw_{i:03d}",
-                    term=f"term{i}",
-                    lemma=f"lemma{i}",
-                    count=1,
-                    source="body",
-                    score=float(i)
-                )
-            )
-        
-        user_prompt, metadata = prompt_builder.build_user_prompt(
-            triage_request, shrink_mode=False
-        )
-        
-        # Should limit to top 10 (normal mode)
-        assert metadata["candidates_count"] == 10
-        
-        # Shrink mode should limit to 5
-        user_prompt_shrink, metadata_shrink = prompt_builder.build_user_prompt(
-            triage_request, shrink_mode=True
-        )
-        assert metadata_shrink["candidates_count"] == 5
@@ -18,42 +18,24 @@ def mock_settings():
     return settings
 
 
-@pytest.fixture(autouse=True)
-def reset_pools():
-    """Reset connection pools before each test."""
-    RedisClient._sync_pool = None
-    RedisClient._async_pool = None
-    yield
-    RedisClient._sync_pool = None
-    RedisClient._async_pool = None
-
-
-def test_get_sync_client_creates_pool(mock_settings):
-    """Test that sync client creates connection pool on first call."""
-    with patch("inference_layer.persistence.redis_client.ConnectionPool") as mock_pool:
-        mock_pool.from_url.return_value = MagicMock()
-        
-        client1 = RedisClient.get_sync_client(mock_settings)
-        client2 = RedisClient.get_sync_client(mock_settings)
-        
-        # Pool should be created only once
-        mock_pool.from_url.assert_called_once_with(
-            mock_settings.REDIS_URL,
-            max_connections=mock_settings.REDIS_MAX_CONNECTIONS,
-            decode_responses=True,
-            socket_timeout=5,
-            socket_connect_timeout=5,
-            retry_on_timeout=True,
-        )
-
-
-def test_get_async_client_creates_pool(mock_settings):
-    """Test that async client creates connection pool on first call."""
-    with patch("inference_layer.persistence.redis_client.AsyncConnectionPool") as mock_pool:
+@pytest.mark.parametrize(
+    "pool_cls,getter,pool_attr",
+    [
+        ("ConnectionPool", "get_sync_client", "_sync_pool"),
+        ("AsyncConnectionPool", "get_async_client", "_async_pool"),
+    ],
+    ids=["sync", "async"],
+)
+def test_get_client_creates_pool(mock_settings, monkeypatch, pool_cls, getter, pool_attr):
+    """Test that sync/async clients create their connection pool on first call."""
+    # monkeypatch restores the class attribute after the test (xdist-safe)
+    monkeypatch.setattr(RedisClient, pool_attr, None)
+    
+    with patch(f"inference_layer.persistence.redis_client.{pool_cls}") as mock_pool:
         mock_pool.from_url.return_value = MagicMock()
         
-        client1 = RedisClient.get_async_client(mock_settings)
-        client2 = RedisClient.get_async_client(mock_settings)
+        client1 = getattr(RedisClient, getter)(mock_settings)
+        client2 = getattr(RedisClient, getter)(mock_settings)
         
         # Pool should be created only once
         mock_pool.from_url.assert_called_once_with(
@@ -66,10 +48,10 @@ def test_get_async_client_creates_pool(mock_settings):
         )
 
 
-def test_close_sync_pool():
+def test_close_sync_pool(monkeypatch):
     """Test closing sync connection pool."""
     mock_pool = MagicMock()
-    RedisClient._sync_pool = mock_pool
+    monkeypatch.setattr(RedisClient, "_sync_pool", mock_pool)
     
     RedisClient.close_sync_pool()
     
@@ -78,11 +60,11 @@ def test_close_sync_pool():
 
 
 @pytest.mark.asyncio
-async def test_close_async_pool():
+async def test_close_async_pool(monkeypatch):
     """Test closing async connection pool."""
     mock_pool = MagicMock()
     mock_pool.disconnect = AsyncMock()  # Must be awaitable
-    RedisClient._async_pool = mock_pool
+    monkeypatch.setattr(RedisClient, "_async_pool", mock_pool)
     
     await RedisClient.close_async_pool()
     
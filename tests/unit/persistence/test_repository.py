@@ -30,6 +30,12 @@ def mock_redis():
     return MagicMock()
 
 
+@pytest.fixture
+def mock_pipeline(mock_redis):
+    """Pipeline returned by mock_redis.pipeline() (same object on every call)."""
+    return mock_redis.pipeline.return_value
+
+
 @pytest.fixture
 def mock_settings():
     """Mock settings."""
@@ -86,39 +92,44 @@ def sample_result():
     )
 
 
-def test_save_result_success(repository, mock_redis, sample_result):
+def test_save_result_success(repository, mock_redis, mock_pipeline, sample_result):
     """Test saving result to Redis."""
     result = repository.save_result(sample_result, task_id="task-123")
     
     assert result is True
     
+    # All writes go through one non-transactional pipeline
+    mock_redis.pipeline.assert_called_once_with(transaction=False)
+    mock_pipeline.execute.assert_called_once()
+    
     # Should call setex for result
-    mock_redis.setex.assert_any_call(
+    mock_pipeline.setex.assert_any_call(
         name="triage:result:test-uid-123",
         time=86400,
         value=sample_result.model_dump_json()
     )
     
     # Should call zadd for index
-    mock_redis.zadd.assert_called_once()
+    mock_pipeline.zadd.assert_called_once()
     
     # Should call setex for task mapping
-    assert mock_redis.setex.call_count == 2
+    assert mock_pipeline.setex.call_count == 2
+    mock_redis.setex.assert_not_called()
 
 
-def test_save_result_no_task_id(repository, mock_redis, sample_result):
+def test_save_result_no_task_id(repository, mock_pipeline, sample_result):
     """Test saving result without task_id."""
     result = repository.save_result(sample_result)
     
     assert result is True
     
     # Should call setex only once (for result, not for task mapping)
-    mock_redis.setex.assert_called_once()
+    mock_pipeline.setex.assert_called_once()
 
 
-def test_save_result_redis_error(repository, mock_redis, sample_result):
+def test_save_result_redis_error(repository, mock_pipeline, sample_result):
     """Test error handling when Redis fails."""
-    mock_redis.setex.side_effect = Exception("Redis error")
+    mock_pipeline.execute.side_effect = Exception("Redis error")
     
     result = repository.save_result(sample_result)
     
@@ -146,17 +157,25 @@ def test_get_result_not_found(repository, mock_redis):
 
 
 def test_get_result_by_task_id_success(repository, mock_redis, sample_result):
-    """Test retrieving result by task ID."""
-    mock_redis.get.side_effect = [
-        "test-uid-123",  # First call returns request_uid
-        sample_result.model_dump_json(),  # Second call returns result
-    ]
+    """Test retrieving result by task ID (one Lua script call)."""
+    get_by_task = repository._get_by_task_script
+    get_by_task.return_value = sample_result.model_dump_json()
     
     result = repository.get_result_by_task_id("task-123")
     
     assert result is not None
     assert result.request_uid == "test-uid-123"
-    assert mock_redis.get.call_count == 2
+    get_by_task.assert_called_once_with(
+        keys=["triage:task:task-123"], args=["triage:result:"]
+    )
+    mock_redis.get.assert_not_called()
+
+
+def test_get_result_by_task_id_not_found(repository):
+    """Test retrieving by unknown task ID (missing mapping or expired result)."""
+    repository._get_by_task_script.return_value = None
+    
+    assert repository.get_result_by_task_id("unknown-task") is None
 
 
 def test_delete_result_success(repository, mock_redis):
@@ -179,7 +198,7 @@ def test_delete_result_not_found(repository, mock_redis):
     assert result is False
 
 
-def test_save_to_dlq_success(repository, mock_redis):
+def test_save_to_dlq_success(repository, mock_redis, mock_pipeline):
     """Test saving failed request to DLQ."""
     # Create mock RetryExhausted exception
     # Do NOT use spec=TriageRequest: Pydantic model fields are not class-level
@@ -203,11 +222,14 @@ def test_save_to_dlq_success(repository, mock_redis):
     result = repository.save_to_dlq(exc)
     
     assert result is True
-    mock_redis.lpush.assert_called_once()
-    mock_redis.ltrim.assert_called_once_with("triage:dlq", 0, 9999)
+    # Push and trim are sent together in one pipeline
+    mock_redis.pipeline.assert_called_once_with(transaction=False)
+    mock_pipeline.lpush.assert_called_once()
+    mock_pipeline.ltrim.assert_called_once_with("triage:dlq", 0, 9999)
+    mock_pipeline.execute.assert_called_once()
     
     # Check DLQ entry structure
-    dlq_json = mock_redis.lpush.call_args[0][1]
+    dlq_json = mock_pipeline.lpush.call_args[0][1]
     dlq_entry = json.loads(dlq_json)
     assert dlq_entry["request_uid"] == "failed-uid-123"
     assert dlq_entry["total_attempts"] == 4
@@ -232,25 +254,42 @@ def test_get_dlq_entries(repository, mock_redis):
 
 def test_get_recent_results(repository, mock_redis, sample_result):
     """Test retrieving recent results."""
-    mock_redis.zrevrange.return_value = ["test-uid-123", "test-uid-456"]
-    mock_redis.get.side_effect = [
+    mock_redis.zrevrange.return_value = ["test-uid-123", "test-uid-456", "test-uid-789"]
+    mock_redis.mget.return_value = [
         sample_result.model_dump_json(),
         sample_result.model_dump_json(),
+        None,  # Expired result still in the index
     ]
     
     results = repository.get_recent_results(limit=10)
     
     assert len(results) == 2
     mock_redis.zrevrange.assert_called_once_with("triage:results:index", 0, 9)
+    mock_redis.mget.assert_called_once_with([
+        "triage:result:test-uid-123",
+        "triage:result:test-uid-456",
+        "triage:result:test-uid-789",
+    ])
+    mock_redis.get.assert_not_called()
+
+
+def test_get_recent_results_empty_index(repository, mock_redis):
+    """Test that an empty index returns no results without calling MGET."""
+    mock_redis.zrevrange.return_value = []
+    
+    assert repository.get_recent_results() == []
+    mock_redis.mget.assert_not_called()
 
 
-def test_get_stats(repository, mock_redis):
+def test_get_stats(repository, mock_pipeline):
     """Test getting repository statistics."""
-    mock_redis.zcard.return_value = 100
-    mock_redis.llen.return_value = 5
+    mock_pipeline.execute.return_value = [100, 5]  # [ZCARD, LLEN]
     
     stats = repository.get_stats()
     
     assert stats["total_results"] == 100
     assert stats["dlq_size"] == 5
     assert stats["result_ttl_seconds"] == 86400
+    mock_pipeline.zcard.assert_called_once_with("triage:results:index")
+    mock_pipeline.llen.assert_called_once_with("triage:dlq")
+    mock_pipeline.execute.assert_called_once()
@@ -2,6 +2,9 @@
 Unit tests for Stage 2: JSON Schema Validation.
 """
 
+import json
+
+import fastjsonschema
 import pytest
 
 from inference_layer.validation.stage2_schema import Stage2SchemaValidation
@@ -320,6 +323,49 @@ class TestStage2SchemaValidation:
         
         assert "not found" in str(exc_info.value).lower()
     
+    @pytest.mark.parametrize("fixture_name", [
+        "valid_llm_response.json",
+        "invalid_schema_response.json",
+        "invalid_business_rules_response.json",
+        "low_quality_response.json",
+    ])
+    def test_fast_path_agrees_with_jsonschema(self, fixtures_dir, fixture_name):
+        """Test that the generated fast validator and jsonschema agree on fixtures."""
+        data = json.loads((fixtures_dir / fixture_name).read_text())
+        validator = self.stage2._get_validator()
+        
+        try:
+            self.stage2._fast_validate(data)
+            fast_valid = True
+        except fastjsonschema.JsonSchemaException:
+            fast_valid = False
+        
+        assert fast_valid == validator.is_valid(data)
+    
+    def test_invalid_schema_raises_on_compile(self, tmp_path):
+        """Test that a malformed schema is rejected when the validator is compiled."""
+        schema_file = tmp_path / "schema.json"
+        schema_file.write_text('{"type": "object", "required": "not-a-list"}')
+        stage2 = Stage2SchemaValidation(str(schema_file))
+        
+        with pytest.raises(SchemaValidationError) as exc_info:
+            stage2.compile()
+        
+        assert "invalid json schema" in str(exc_info.value).lower()
+    
+    def test_schema_defaults_not_written_into_data(self, tmp_path):
+        """Test that validation leaves the parsed response untouched."""
+        schema_file = tmp_path / "schema.json"
+        schema_file.write_text(
+            '{"type": "object", "properties": {"note": {"type": "string", "default": "x"}}}'
+        )
+        stage2 = Stage2SchemaValidation(str(schema_file))
+        data = {}
+        
+        stage2.validate(data)
+        
+        assert data == {}
+    
     def test_multiple_errors_collected(self):
         """Test that multiple validation errors are collected."""
         data = {
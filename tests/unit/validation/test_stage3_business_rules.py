@@ -3,6 +3,7 @@ Unit tests for Stage 3: Business Rules Validation.
 """
 
 import pytest
+from prometheus_client import REGISTRY
 from datetime import datetime
 
 from inference_layer.models.enums import TopicsEnum, SentimentEnum, PriorityEnum
@@ -259,6 +260,62 @@ class TestStage3BusinessRules:
         assert "INVALID_TOPIC" in str(exc_info.value)
         assert "topics[1]" in exc_info.value.details["field_path"]
     
+    def test_multiple_violations_aggregated_into_single_error(self):
+        """Test that all violated rules are reported in one BusinessRuleViolation."""
+        invalid_topic = TopicResult.model_construct(
+            labelid="INVENTED_TOPIC",  # Invalid!
+            confidence=0.9,
+            keywordsintext=[KeywordInText(candidateid="hash_INVENTED")],  # Invalid!
+            evidence=[EvidenceItem(quote="test")]
+        )
+        response = EmailTriageResponse.model_construct(
+            dictionaryversion=999,  # Mismatch!
+            sentiment=SentimentResult(value="neutral", confidence=0.8),
+            priority=PriorityResult(value="medium", confidence=0.7, signals=[]),
+            topics=[invalid_topic]
+        )
+        
+        with pytest.raises(BusinessRuleViolation) as exc_info:
+            self.stage3.validate(response, self.request)
+        
+        error = exc_info.value
+        assert error.details["rule_name"] == "multiple_rules"
+        assert [sub.details["rule_name"] for sub in error.sub_errors] == [
+            "dictionary_version_match",
+            "topic_label_in_enum",
+            "candidateid_exists_in_input",
+        ]
+        assert len(error.details["sub_errors"]) == 3
+        assert "3 business rule violations" in str(error)
+
+    def test_multiple_violations_counted_as_one_failure(self):
+        """Test that a rejected response increments the failure counter once."""
+        invalid_topic = TopicResult.model_construct(
+            labelid="INVENTED_TOPIC",
+            confidence=0.9,
+            keywordsintext=[KeywordInText(candidateid="hash_INVENTED")],
+            evidence=[EvidenceItem(quote="test")]
+        )
+        response = EmailTriageResponse.model_construct(
+            dictionaryversion=999,
+            sentiment=SentimentResult(value="neutral", confidence=0.8),
+            priority=PriorityResult(value="medium", confidence=0.7, signals=[]),
+            topics=[invalid_topic]
+        )
+        labels = {"stage": "stage3", "error_type": "multiple_rules"}
+        before = REGISTRY.get_sample_value("validation_failures_total", labels) or 0.0
+        topic_before = REGISTRY.get_sample_value(
+            "validation_failures_total", {"stage": "stage3", "error_type": "invalid_topic_label"}
+        ) or 0.0
+        
+        with pytest.raises(BusinessRuleViolation):
+            self.stage3.validate(response, self.request)
+        
+        assert REGISTRY.get_sample_value("validation_failures_total", labels) == before + 1
+        assert (REGISTRY.get_sample_value(
+            "validation_failures_total", {"stage": "stage3", "error_type": "invalid_topic_label"}
+        ) or 0.0) == topic_before
+    
     def test_invalid_sentiment_value_raises_error(self):
         """Test that invalid sentiment value raises BusinessRuleViolation."""
         topic = TopicResult(
@@ -182,6 +182,30 @@ class TestStage4QualityChecks:
         assert len(warnings) >= 1
         assert any("duplicate evidence" in w.lower() for w in warnings)
     
+    def test_evidence_copy_with_new_quote_not_duplicate(self):
+        """Test that model_copy(update=quote) re-normalizes the copied evidence."""
+        original = EvidenceItem(quote="First quote")
+        assert original.quote_normalized == "first quote"  # Read before copying
+        
+        copied = original.model_copy(update={"quote": "Second quote"})
+        assert copied.quote_normalized == "second quote"
+        
+        response = self.create_minimal_valid_response(
+            topics=[
+                TopicResult(
+                    labelid="CONTRATTO",
+                    confidence=0.9,
+                    keywordsintext=[
+                        KeywordInText(candidateid="h1", lemma="test", count=1)
+                    ],
+                    evidence=[original, copied]
+                )
+            ]
+        )
+        warnings = self.stage4.validate(response)
+        
+        assert not any("duplicate evidence" in w.lower() for w in warnings)
+    
     def test_topic_without_keywords_warning(self):
         """Test that topic without keywords produces warning."""
         # Use model_construct to bypass Pydantic min_length=1 constraint
@@ -300,4 +324,16 @@ class TestStage4QualityChecks:
         
         assert len(warnings) >= 1
         assert any("sentiment" in w.lower() and "0.400" in w for w in warnings)
-
+    
+    def test_iter_warnings_matches_validate(self):
+        """Test that iter_warnings lazily yields the same warnings as validate."""
+        response = self.create_minimal_valid_response(
+            sentiment=SentimentResult(value="neutral", confidence=0.1),
+            priority=PriorityResult(value="medium", confidence=0.1, signals=[])
+        )
+        
+        warnings_iter = self.stage4.iter_warnings(response)
+        
+        assert not isinstance(warnings_iter, list)
+        assert "sentiment confidence" in next(warnings_iter).lower()
+        assert list(self.stage4.iter_warnings(response)) == self.stage4.validate(response)
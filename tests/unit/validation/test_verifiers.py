@@ -23,6 +23,8 @@ from inference_layer.validation.verifiers import (
     EvidencePresenceVerifier,
     KeywordPresenceVerifier,
     SpansCoherenceVerifier,
+    VerificationContext,
+    _maybe_lower,
 )
 
 
@@ -103,6 +105,29 @@ class TestEvidencePresenceVerifier:
         warnings = self.verifier.verify(response, self.request)
         assert warnings == []
     
+    def test_verify_with_shared_context(self):
+        """Test that verify accepts a context built once by the pipeline."""
+        response = EmailTriageResponse(
+            dictionaryversion=1,
+            sentiment=SentimentResult(value="neutral", confidence=0.8),
+            priority=PriorityResult(value="medium", confidence=0.7, signals=[]),
+            topics=[
+                TopicResult(
+                    labelid="CONTRATTO",
+                    confidence=0.9,
+                    keywordsintext=[
+                        KeywordInText(candidateid="h1", lemma="contratto", count=1)
+                    ],
+                    evidence=[EvidenceItem(quote="informazioni sul contratto")]
+                )
+            ]
+        )
+        context = VerificationContext.from_request(self.request)
+        
+        assert context.email_text_lower == self.email_doc.body_text_canonical.lower()
+        assert context.text_length == len(self.email_doc.body_text_canonical)
+        assert self.verifier.verify(response, self.request, context) == []
+    
     def test_evidence_not_found_warning(self):
         """Test that evidence quote not found in text produces warning."""
         response = EmailTriageResponse(
@@ -572,7 +597,12 @@ class TestSpansCoherenceVerifier:
         assert len(warnings) >= 1
         assert any("end > text length" in w for w in warnings)
     
-    def test_span_invalid_format_warning(self):
+    @pytest.mark.parametrize(
+        "span",
+        [[10, 20, 30], "ab"],
+        ids=["three_elements", "two_char_string"],
+    )
+    def test_span_invalid_format_warning(self, span):
         """Test that span with invalid format produces warning."""
         # Use model_construct to bypass Pydantic's tuple[int,int] constraint so we
         # can verify the SpansCoherenceVerifier still catches malformed spans.
@@ -580,7 +610,7 @@ class TestSpansCoherenceVerifier:
             candidateid="h1",
             lemma="test",
             count=1,
-            spans=[[10, 20, 30]]  # 3-element span – invalid format
+            spans=[span]
         )
         topic = TopicResult.model_construct(
             labelid="CONTRATTO",
@@ -624,6 +654,66 @@ class TestSpansCoherenceVerifier:
         assert any("evidence" in w and ("end > text length" in w or "text length" in w) for w in warnings)
 
 
+class TestMaybeLower:
+    """Test suite for the lowercase fast path used by VerificationContext."""
+    
+    def test_lowercase_ascii_returned_unchanged(self):
+        """Test that already-lowercase ASCII text is returned without copying."""
+        text = "vorrei informazioni sul contratto."
+        assert _maybe_lower(text) is text
+    
+    def test_mixed_case_and_non_ascii_lowercased(self):
+        """Test that other inputs fall back to str.lower()."""
+        assert _maybe_lower("Vorrei INFO") == "vorrei info"
+        assert _maybe_lower("Perché È così") == "perché è così"
 
 
-
+class TestVerificationContext:
+    """Test suite for the shared VerificationContext."""
+    
+    def test_context_lowercases_body_text(self):
+        """Test that the context carries the raw and lowercased body text."""
+        request = TriageRequest(
+            email=create_test_email_doc("Vorrei informazioni sul CONTRATTO."),
+            candidate_keywords=[
+                CandidateKeyword(
+                    candidate_id="test_001",
+                    term="contratto",
+                    lemma="contratto",
+                    count=1,
+                    source="body",
+                    score=0.9
+                )
+            ],
+            dictionary_version=1
+        )
+        
+        context = VerificationContext.from_request(request)
+        
+        assert context.email_text == "Vorrei informazioni sul CONTRATTO."
+        assert context.email_text_lower == "vorrei informazioni sul contratto."
+        assert context.text_length == len(context.email_text)
+    
+    def test_context_carries_candidate_map(self):
+        """Test that the context exposes candidates with lowercased term/lemma."""
+        request = TriageRequest(
+            email=create_test_email_doc("Vorrei informazioni sul contratto."),
+            candidate_keywords=[
+                CandidateKeyword(
+                    candidate_id="test_001",
+                    term="Contratto",
+                    lemma="CONTRATTO",
+                    count=1,
+                    source="body",
+                    score=0.9
+                )
+            ],
+            dictionary_version=1
+        )
+        
+        context = VerificationContext.from_request(request)
+        
+        assert set(context.candidate_map) == {"test_001"}
+        assert context.candidate_map["test_001"].term == "Contratto"
+        assert context.candidate_map["test_001"].term_lower == "contratto"
+        assert context.candidate_map["test_001"].lemma_lower == "contratto"